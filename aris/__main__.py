@@ -2,10 +2,60 @@
 Entry point for running ARIS as a module.
 """
 import sys
+import signal
 import asyncio
 
 from .cli_args import initialize_environment
-from .cli import fully_initialize_app_components, run_cli_orchestrator
+from .cli import (
+    fully_initialize_app_components, run_cli_orchestrator, _shutdown_mcp_servers,
+    request_shutdown, is_shutdown_requested
+)
+from .logging_utils import log_router_activity
+
+
+def _run_main_task(loop, coro):
+    """
+    Run ``coro`` to completion as the loop's main task.
+    
+    SIGTERM requests a shutdown and cancels the task so its cleanup runs on the loop
+    instead of the process dying mid-await. SIGINT is left to the InterruptHandler's
+    multi-level handling.
+    
+    Returns:
+        True if the run was ended by SIGTERM, so the caller should not start any
+        further phases; False if the task ran to completion
+    """
+    main_task = loop.create_task(coro)
+    
+    def _on_sigterm():
+        request_shutdown()
+        main_task.cancel()
+    
+    try:
+        loop.add_signal_handler(signal.SIGTERM, _on_sigterm)
+    except (NotImplementedError, AttributeError):
+        # Windows event loops do not support add_signal_handler
+        pass
+    
+    try:
+        loop.run_until_complete(main_task)
+    except asyncio.CancelledError:
+        log_router_activity("Chat session ended by SIGTERM.")
+    except BaseException:
+        # A KeyboardInterrupt from the SIGINT handler can leave run_until_complete
+        # with the task still pending. Cancel it and let its own cleanup finish now,
+        # or the next run of the loop would resume it and it would only die at GC.
+        if not main_task.done():
+            request_shutdown()
+            main_task.cancel()
+            loop.run_until_complete(asyncio.gather(main_task, return_exceptions=True))
+        raise
+    finally:
+        try:
+            loop.remove_signal_handler(signal.SIGTERM)
+        except (NotImplementedError, AttributeError):
+            pass
+    return is_shutdown_requested()
 
 def main():
     """Main entry point for the CLI."""
@@ -75,26 +125,26 @@ def main():
             import aris.cli
             aris.cli._SUPPRESS_INTERACTIVE_OUTPUT = True
         
-        # Initialize components
-        loop.run_until_complete(fully_initialize_app_components())
+        # Initialize components; a SIGTERM here skips the session entirely
+        if _run_main_task(loop, fully_initialize_app_components()):
+            return
         
         if mode == "non_interactive":
             # Run non-interactive mode
-            loop.run_until_complete(execute_non_interactive_mode(user_input))
+            _run_main_task(loop, execute_non_interactive_mode(user_input))
         else:
             # Run main orchestrator (interactive mode)
-            loop.run_until_complete(run_cli_orchestrator())
+            _run_main_task(loop, run_cli_orchestrator())
     except KeyboardInterrupt:
         from prompt_toolkit import print_formatted_text
-        from prompt_toolkit.formatted_text import FormattedText
-        from .cli import cli_style
-        from .logging_utils import log_router_activity
+        from .cli import cli_style, _MSG_EXITING_CTRL_C
         
-        print_formatted_text(FormattedText([
-            ("bold", "\nExiting ARIS via Ctrl+C...")
-        ]), style=cli_style)
+        print_formatted_text(_MSG_EXITING_CTRL_C, style=cli_style)
         log_router_activity("Chat session ended by KeyboardInterrupt.")
     finally:
+        # The main task has finished its own cleanup by now; this only catches servers
+        # left running if that cleanup was skipped (e.g. an interrupt during startup)
+        loop.run_until_complete(_shutdown_mcp_servers())
         loop.close()
 
 if __name__ == "__main__":
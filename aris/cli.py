@@ -1,27 +1,45 @@
 """
 Main entry point for ARIS.
 """
+import io
 import os
 import sys
 import asyncio
-import threading
-import signal
+import contextlib
+import functools
 import json
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Tuple
 
-from prompt_toolkit import PromptSession, print_formatted_text
+import uvicorn
+from prompt_toolkit import print_formatted_text
 from prompt_toolkit.formatted_text import FormattedText
 
+# Prefer orjson for per-chunk stream parsing when installed; its JSONDecodeError
+# subclasses json.JSONDecodeError so error handling is unchanged
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Global server state tracking (module-level to persist across CLI lifecycle)
 _workflow_mcp_server_started = False
 _profile_mcp_server_started = False
 
-# Global server tracking for cleanup
-_profile_mcp_server_thread = None
-_workflow_mcp_server_thread = None
-_signal_handler_task = None
+# Global server tracking for cleanup (uvicorn servers run as tasks on the CLI event loop)
+_profile_uv_server = None
+_workflow_uv_server = None
+_profile_mcp_task = None
+_workflow_mcp_task = None
+
+# Cached --verbose and --profile values, set once arguments are final in fully_initialize_app_components
+_VERBOSE = False
+_STARTUP_PROFILE = "default"
+
+# Seconds uvicorn waits for open connections to close before forcing shutdown
+_MCP_GRACEFUL_SHUTDOWN_TIMEOUT = 5
 
 def is_workflow_mcp_server_started() -> bool:
     """Check if workflow MCP server has been started."""
@@ -30,31 +48,46 @@ def is_workflow_mcp_server_started() -> bool:
 def is_profile_mcp_server_started() -> bool:
     """Check if profile MCP server has been started."""
     return _profile_mcp_server_started
-from prompt_toolkit.history import FileHistory
-from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
 from prompt_toolkit.styles import Style
 
 # Import local modules
 from .logging_utils import log_router_activity, log_warning, log_error, log_debug
-from .cli_args import initialize_environment, PARSED_ARGS, INITIAL_VOICE_MODE, TEXT_MODE_TTS_ENABLED, TRIGGER_WORDS
+from . import cli_args
+from .cli_args import initialize_environment, PARSED_ARGS, INITIAL_VOICE_MODE, TRIGGER_WORDS
 from .session_state import SessionState, get_current_session_state, set_current_session_state
-from .interaction_handler import print_welcome_message, text_mode_one_turn
-from .voice_handler import VoiceHandler
 from .profile_manager import profile_manager
 from .profile_handler import activate_profile
-from .interrupt_handler import InterruptHandler
+from .interrupt_handler import get_interrupt_handler
 from .workspace_manager import workspace_manager
+from .context_file_manager import context_file_manager
 from .progress_tracker import create_progress_tracker, ExecutionPhase
+from .profile_mcp_server import ProfileMCPServer
+from .workflow_mcp_server import WorkflowMCPServer
 
 # Global variable to indicate if full initialization is done
 _APP_INITIALIZED = False
 
 # Global interrupt handler instance
-interrupt_handler = InterruptHandler()
+interrupt_handler = get_interrupt_handler()
 
 # Global flag to suppress interactive output in non-interactive mode
 _SUPPRESS_INTERACTIVE_OUTPUT = False
 
+# Set when the process is asked to terminate (SIGTERM); the orchestrator loop
+# checks it so a cancelled turn ends the session instead of re-prompting
+_SHUTDOWN_REQUESTED = False
+
+
+def request_shutdown():
+    """Ask the orchestrator loop to end the session at its next check."""
+    global _SHUTDOWN_REQUESTED
+    _SHUTDOWN_REQUESTED = True
+
+
+def is_shutdown_requested() -> bool:
+    """Check if a shutdown has been requested."""
+    return _SHUTDOWN_REQUESTED
+
 
 def detect_execution_mode(args) -> Tuple[str, Optional[str]]:
     """
@@ -75,7 +108,7 @@ def detect_execution_mode(args) -> Tuple[str, Optional[str]]:
     # Check if stdin has input available
     if not sys.stdin.isatty():
         try:
-            stdin_input = sys.stdin.read().strip()
+            stdin_input = _read_all_stdin()
             if stdin_input:
                 return "non_interactive", stdin_input
         except Exception as e:
@@ -84,126 +117,226 @@ def detect_execution_mode(args) -> Tuple[str, Optional[str]]:
     return "interactive", None
 
 
-def parse_claude_response_stream(response_chunks: List[str]) -> str:
+async def detect_execution_mode_async(args) -> Tuple[str, Optional[str]]:
     """
-    Parse Claude CLI JSON stream IDENTICALLY to how interactive mode handles it.
+    Async variant of detect_execution_mode for callers with a running event loop.
     
-    This preserves the EXACT SAME response processing logic.
+    The blocking stdin read is moved to a worker thread so other startup tasks
+    can keep running while a pipe is being drained.
+    
+    Returns:
+        Tuple of (mode, input_text) where mode is 'interactive' or 'non_interactive'
     """
-    response_content = []
-    final_result = None
+    # Check for explicit --input flag (including empty strings)
+    if hasattr(args, 'input') and args.input is not None:
+        return "non_interactive", args.input
     
-    for chunk in response_chunks:
-        if not chunk.strip():
-            continue
-            
+    # Check if stdin has input available
+    if not sys.stdin.isatty():
+        try:
+            stdin_input = await asyncio.to_thread(_read_all_stdin)
+            if stdin_input:
+                return "non_interactive", stdin_input
+        except Exception as e:
+            log_error(f"Failed to read from stdin: {e}")
+    
+    return "interactive", None
+
+
+def _read_all_stdin() -> str:
+    """Read piped stdin to EOF and return it stripped of surrounding whitespace."""
+    return sys.stdin.read().strip()
+
+
+# Top-level event types whose payload the parser never reads: tool_use carries the
+# tool arguments and user carries tool results, both potentially large
+_IGNORED_EVENT_TYPES = ("tool_use", "user", "system")
+
+# Serialized prefixes of those events (compact and default json.dumps spacing), so they
+# can be recognised from the type field alone without decoding the whole chunk
+_IGNORED_EVENT_PREFIXES = tuple(
+    prefix
+    for event_type in _IGNORED_EVENT_TYPES
+    for prefix in (f'{{"type":"{event_type}"', f'{{"type": "{event_type}"')
+)
+
+
+class _ResponseStreamParser:
+    """
+    Incremental form of parse_claude_response_stream.
+    
+    Chunks are fed one at a time as route() yields them, so a long streamed
+    response never has to be buffered as a list of raw JSON chunks.
+    """
+    
+    __slots__ = ("_fragments", "_add_text", "_final_result", "_error")
+    
+    def __init__(self):
+        # A single assistant event can carry several text items, so the number of
+        # chunks is not an upper bound on fragments; rely on amortized append
+        self._fragments: List[str] = []
+        self._add_text = self._fragments.append
+        self._final_result: Optional[str] = None
+        self._error: Optional[str] = None
+    
+    def feed(self, chunk: str) -> None:
+        """Apply one JSON stream chunk to the response being assembled."""
+        if self._error is not None:
+            # Nothing after an error event contributes to the response
+            return
+        
+        # Every stream event is a JSON object, so blank lines and plain-text fragments
+        # are skipped here rather than through a JSONDecodeError
+        chunk = chunk.lstrip()
+        if not chunk.startswith('{'):
+            return
+        
+        # Only the type, text, result and error fields are ever read; events of a type
+        # we ignore are skipped from their leading type field before a full JSON decode
+        if chunk.startswith(_IGNORED_EVENT_PREFIXES):
+            return
+        
         try:
             # Parse each JSON chunk exactly like interactive mode
-            data = json.loads(chunk)
-            
-            # Handle all the same event types as interactive mode
-            if data.get('type') == 'text':
-                # Main response content
-                response_content.append(data.get('text', ''))
-            elif data.get('type') == 'assistant':
-                # Assistant message with content
-                message = data.get('message', {})
-                content = message.get('content', [])
-                for item in content:
-                    if item.get('type') == 'text':
-                        response_content.append(item.get('text', ''))
-            elif data.get('type') == 'result':
-                # Final result from Claude CLI - use this as the authoritative response
-                result_text = data.get('result', '')
-                if result_text:
-                    final_result = result_text
-            elif data.get('type') == 'tool_use':
-                # Tool usage events (preserve all tool functionality)
-                # In non-interactive, we don't show tool usage but tools still execute
-                pass
-            elif data.get('type') == 'error':
-                # Error handling (preserve all error reporting)
-                error_msg = data.get('error', {}).get('message', 'Unknown error')
-                raise RuntimeError(f"Claude error: {error_msg}")
-            # Add handling for other event types as needed
-            
+            data = _json_loads(chunk)
         except json.JSONDecodeError:
             # Handle malformed JSON (same as interactive)
-            continue
-        except Exception as e:
-            # Preserve all error handling from interactive mode
-            raise
+            return
+        
+        # Handle all the same event types as interactive mode with one dict lookup;
+        # tool_use and unknown types have no handler
+        handler = self._EVENT_HANDLERS.get(data.get('type'))
+        if handler is not None:
+            handler(self, data)
+    
+    def _on_text(self, data: dict) -> None:
+        # Main response content
+        self._add_text(data.get('text', ''))
+    
+    def _on_assistant(self, data: dict) -> None:
+        # Assistant message with content
+        message = data.get('message', {})
+        content = message.get('content', [])
+        for item in content:
+            if item.get('type') == 'text':
+                self._add_text(item.get('text', ''))
+    
+    def _on_result(self, data: dict) -> None:
+        # Final result from Claude CLI - use this as the authoritative response
+        result_text = data.get('result', '')
+        if result_text:
+            self._final_result = result_text
+    
+    def _on_error(self, data: dict) -> None:
+        # Error handling (preserve all error reporting); raised from result() so
+        # the caller can finish draining the stream first
+        self._error = data.get('error', {}).get('message', 'Unknown error')
+    
+    # Tool usage events are not shown in non-interactive mode but tools still execute.
+    # Add handling for other event types here as needed
+    _EVENT_HANDLERS = {
+        'text': _on_text,
+        'assistant': _on_assistant,
+        'result': _on_result,
+        'error': _on_error,
+    }
+    
+    def result(self) -> str:
+        """Return the assembled response, raising RuntimeError if an error event was seen."""
+        if self._error is not None:
+            raise RuntimeError(f"Claude error: {self._error}")
+        
+        # Return the final result if available (most authoritative), otherwise assembled content
+        if self._final_result:
+            return self._final_result.strip()
+        return "".join(self._fragments).strip()
+
+
+def parse_claude_response_stream(response_chunks: List[str]) -> str:
+    """
+    Parse Claude CLI JSON stream IDENTICALLY to how interactive mode handles it.
     
-    # Return the final result if available (most authoritative), otherwise assembled content
-    if final_result:
-        return final_result.strip()
-    else:
-        return "".join(response_content).strip()
+    This preserves the EXACT SAME response processing logic.
+    """
+    parser = _ResponseStreamParser()
+    feed = parser.feed
+    for chunk in response_chunks:
+        feed(chunk)
+    return parser.result()
 
 
 def format_non_interactive_response(response: str, session_state, progress_tracker=None) -> str:
     """Enhanced response formatting with session insights if available"""
-    if not response.strip():
+    response = response.strip()
+    if not response:
         return ""
     
-    # Get active profile info
+    # Get active profile info (session_state may be None or lack the attribute)
     profile_name = "aris"
-    if session_state and hasattr(session_state, 'active_profile'):
+    try:
         profile = session_state.active_profile
-        if profile and profile.get('profile_name'):
-            profile_name = profile['profile_name']
+    except AttributeError:
+        profile = None
+    if profile and profile.get('profile_name'):
+        profile_name = profile['profile_name']
     
     # Split response into lines for formatting
-    lines = response.strip().split('\n')
-    if not lines:
-        return ""
+    lines = response.split('\n')
     
-    formatted_lines = []
+    # Write straight into one buffer instead of collecting a list of lines
+    buf = io.StringIO()
     
     # First line gets profile prefix with emoji
-    first_line = lines[0]
-    formatted_lines.append(f"🤖 {profile_name}: {first_line}")
-    
-    # Subsequent lines get proper indentation to align with content
-    if len(lines) > 1:
-        for line in lines[1:]:
-            if line.strip():  # Only indent non-empty lines
-                # Calculate indent to align with the content after the prefix
-                prefix_length = len(f"🤖 {profile_name}: ")
-                formatted_lines.append(" " * prefix_length + line)
-            else:
-                formatted_lines.append("")  # Preserve empty lines
-    
-    # Add completion summary if insights are available
-    if progress_tracker and hasattr(progress_tracker, 'get_completion_summary'):
-        summary = progress_tracker.get_completion_summary()
-        if summary and summary.get("metrics"):
-            metrics = summary["metrics"]
+    prefix = f"🤖 {profile_name}: "
+    buf.write(prefix)
+    buf.write(lines[0])
+    
+    # Subsequent lines get indentation that aligns with the content after the prefix
+    indent = " " * len(prefix)
+    for line in lines[1:]:
+        buf.write("\n")
+        if line.strip():  # Only indent non-empty lines
+            buf.write(indent)
+            buf.write(line)
+        # Empty lines are preserved as bare newlines
+    
+    # Add completion summary if insights are available and recorded any activity
+    try:
+        has_metrics = progress_tracker.has_metrics
+    except AttributeError:  # No tracker, or one without insights support
+        has_metrics = None
+    summary = progress_tracker.get_completion_summary() if has_metrics and has_metrics() else None
+    metrics = summary.get("metrics") if summary else None
+    
+    if metrics:
+        total_cost = metrics.get("total_cost", 0)
+        files_created = metrics.get("files_created", 0)
+        
+        # Add metrics footer for significant operations
+        if total_cost > 0.05 or files_created > 0:
+            footer_parts = []
             
-            # Add metrics footer for significant operations
-            if metrics.get("total_cost", 0) > 0.05 or metrics.get("files_created", 0) > 0:
-                footer_parts = []
-                
-                if metrics.get("total_cost", 0) > 0:
-                    footer_parts.append(f"💰 ${metrics['total_cost']:.2f}")
-                
-                if metrics.get("duration_seconds", 0) > 10:
-                    duration = metrics["duration_seconds"]
-                    if duration >= 60:
-                        footer_parts.append(f"⏱️ {int(duration//60)}m {int(duration%60)}s")
-                    else:
-                        footer_parts.append(f"⏱️ {int(duration)}s")
-                
-                if metrics.get("files_created", 0) > 0:
-                    footer_parts.append(f"📁 {metrics['files_created']} files created")
-                
-                if metrics.get("files_modified", 0) > 0:
-                    footer_parts.append(f"✏️ {metrics['files_modified']} files updated")
-                
-                if footer_parts:
-                    formatted_lines.append(f"\n📈 Session metrics: {' • '.join(footer_parts)}")
+            if total_cost > 0:
+                footer_parts.append(f"💰 ${total_cost:.2f}")
+            
+            duration = metrics.get("duration_seconds", 0)
+            if duration > 10:
+                if duration >= 60:
+                    footer_parts.append(f"⏱️ {int(duration//60)}m {int(duration%60)}s")
+                else:
+                    footer_parts.append(f"⏱️ {int(duration)}s")
+            
+            if files_created > 0:
+                footer_parts.append(f"📁 {files_created} files created")
+            
+            files_modified = metrics.get("files_modified", 0)
+            if files_modified > 0:
+                footer_parts.append(f"✏️ {files_modified} files updated")
+            
+            if footer_parts:
+                buf.write(f"\n\n📈 Session metrics: {' • '.join(footer_parts)}")
     
-    return '\n'.join(formatted_lines)
+    return buf.getvalue()
 
 
 async def execute_single_turn(user_input: str, session_state, progress_tracker=None) -> str:
@@ -214,9 +347,12 @@ async def execute_single_turn(user_input: str, session_state, progress_tracker=N
     """
     from .orchestrator import route
     
-    # Use IDENTICAL route call as in text_mode_one_turn
-    response_chunks = []
+    # Parse the IDENTICAL JSON stream that interactive mode receives, chunk by chunk
+    # as it arrives rather than after buffering the whole transcript
+    parser = _ResponseStreamParser()
+    feed = parser.feed
     
+    # Use IDENTICAL route call as in text_mode_one_turn
     async for chunk in route(
         user_msg_for_turn=user_input,
         claude_session_to_resume=session_state.session_id,  # Support session resumption
@@ -226,10 +362,9 @@ async def execute_single_turn(user_input: str, session_state, progress_tracker=N
         is_first_message=session_state.is_first_message(),
         progress_tracker=progress_tracker
     ):
-        response_chunks.append(chunk)
+        feed(chunk)
     
-    # Parse the IDENTICAL JSON stream that interactive mode receives
-    return parse_claude_response_stream(response_chunks)
+    return parser.result()
 
 
 async def execute_non_interactive_mode(user_input: str):
@@ -240,12 +375,12 @@ async def execute_non_interactive_mode(user_input: str):
     """
     exit_code = 0
     
-    # Check if verbose mode is enabled
-    from .cli_args import PARSED_ARGS
-    verbose_mode = PARSED_ARGS and PARSED_ARGS.verbose
+    # Check if verbose mode is enabled (read the live value parsed by cli_args)
+    parsed_args = cli_args.PARSED_ARGS
+    verbose_mode = parsed_args and parsed_args.verbose
     
     # Insights enabled by default, only disabled if flag is present
-    enable_insights = not getattr(PARSED_ARGS, 'disable_insights', False)
+    enable_insights = not getattr(parsed_args, 'disable_insights', False)
     
     # Create progress tracker for non-interactive mode
     progress_tracker = create_progress_tracker(
@@ -259,7 +394,6 @@ async def execute_non_interactive_mode(user_input: str):
         progress_tracker.update_phase(ExecutionPhase.INITIALIZING, "Setting up session")
         
         # Get current session state (should be set up by fully_initialize_app_components)
-        from .session_state import get_current_session_state
         session_state = get_current_session_state()
         
         if not session_state:
@@ -288,10 +422,11 @@ async def execute_non_interactive_mode(user_input: str):
         progress_tracker.stop_display()
         
         # IDENTICAL cleanup to interactive mode
+        await _shutdown_mcp_servers()
         workspace_manager.restore_original_directory()
     
     # Exit with appropriate code
-    log_debug(f"About to exit non-interactive mode with code: {exit_code}")
+    log_debug("About to exit non-interactive mode with code: %s", exit_code)
     sys.exit(exit_code)
 
 # Define a simple style for prompt_toolkit outputs
@@ -309,6 +444,48 @@ cli_style = Style.from_dict({
     'variable.description': 'fg:magenta'
 })
 
+# Every orchestrator message is printed with cli_style
+_print_styled = functools.partial(print_formatted_text, style=cli_style)
+
+# Fixed status messages, built once instead of on every mode switch or exit
+_MSG_EXITING = FormattedText([("bold", "\nExiting ARIS...")])
+_MSG_EXITING_CTRL_C = FormattedText([("bold", "\nExiting ARIS via Ctrl+C...")])
+_MSG_NEW_CONVERSATION = FormattedText([("bold", "✨ Starting a new conversation.")])
+_MSG_OPERATION_CANCELLED = FormattedText([('class:warning', "\n⚠️ Operation cancelled by user.")])
+_MSG_SWITCHED_TO_TEXT_MODE = FormattedText([
+    ("bold fg:green", "\n⌨️ Switched to text mode. Type 'exit' or Ctrl+C to leave.")
+])
+_MSG_TEXT_MODE_TTS_ON = FormattedText([
+    ("bold fg:green", "⌨️ Text mode enabled. TTS is ON ('/speak off' to disable). 'exit' or Ctrl+C to leave.")
+])
+_MSG_TEXT_MODE_TTS_OFF = FormattedText([
+    ("bold fg:green", "⌨️ Text mode enabled. Type '/voice on' to switch or '/speak on' for TTS output. 'exit' or Ctrl+C to leave.")
+])
+_MSG_VOICE_RECORDER_INACTIVE = FormattedText([
+    ('class:error', "Error: Voice recorder not active! Switching to text mode.")
+])
+_MSG_VOICE_INIT_FAILED = FormattedText([
+    ('class:error', "Error initializing voice mode. Staying in text mode.")
+])
+_MSG_VOICE_UNAVAILABLE = FormattedText([
+    ('class:error', "Cannot switch to voice mode due to missing dependencies or API key. Staying in text mode.")
+])
+
+# Mode banners only vary by profile name, so each is built once per profile
+@functools.lru_cache(maxsize=8)
+def _voice_mode_banner(profile_name: str, hint: str) -> FormattedText:
+    return FormattedText([
+        ("bold fg:magenta", f"🎙️ Voice mode enabled with profile '{profile_name}'."),
+        ("", hint)
+    ])
+
+@functools.lru_cache(maxsize=8)
+def _text_mode_banner(profile_name: str) -> FormattedText:
+    return FormattedText([
+        ("bold fg:green", f"⌨️ Text mode enabled with profile '{profile_name}'."),
+        ("", " Type '/voice on' to switch or '/speak on' for TTS output. 'exit' or Ctrl+C to leave.")
+    ])
+
 async def fully_initialize_app_components():
     """Initialize all components needed for the CLI."""
     global _APP_INITIALIZED
@@ -316,12 +493,20 @@ async def fully_initialize_app_components():
         return
     
     # Check if PARSED_ARGS is initialized, if not, initialize it
-    global PARSED_ARGS, INITIAL_VOICE_MODE
+    global PARSED_ARGS, INITIAL_VOICE_MODE, TRIGGER_WORDS
     if PARSED_ARGS is None:
-        log_error("PARSED_ARGS is None - calling initialize_environment() automatically")
-        initialize_environment()
-        # Re-import the updated globals
-        from .cli_args import PARSED_ARGS, INITIAL_VOICE_MODE
+        if cli_args.PARSED_ARGS is None:
+            log_error("PARSED_ARGS is None - calling initialize_environment() automatically")
+            initialize_environment()
+        # Pick up the values parsed after this module was imported
+        PARSED_ARGS = cli_args.PARSED_ARGS
+        INITIAL_VOICE_MODE = cli_args.INITIAL_VOICE_MODE
+        TRIGGER_WORDS = cli_args.TRIGGER_WORDS
+    
+    # PARSED_ARGS is final from here on, so cache the flags read again later once
+    global _VERBOSE, _STARTUP_PROFILE
+    _VERBOSE = bool(getattr(PARSED_ARGS, 'verbose', False))
+    _STARTUP_PROFILE = getattr(PARSED_ARGS, 'profile', None) or "default"
     
     # Initialize without MCP config - it will be loaded when a profile is activated
     from .orchestrator import initialize_router_components
@@ -329,17 +514,17 @@ async def fully_initialize_app_components():
     
     # TTS enablement logic that depends on other modules/args
     if PARSED_ARGS.speak and not INITIAL_VOICE_MODE: 
-        log_debug(f"Attempting to enable TTS for text mode. PARSED_ARGS.speak: {PARSED_ARGS.speak}, INITIAL_VOICE_MODE: {INITIAL_VOICE_MODE}")
+        log_debug("Attempting to enable TTS for text mode. PARSED_ARGS.speak: %s, INITIAL_VOICE_MODE: %s", PARSED_ARGS.speak, INITIAL_VOICE_MODE)
         
         from .tts_handler import _ensure_voice_dependencies, _init_openai_clients_for_tts
         
         dependencies_ok = _ensure_voice_dependencies()
-        log_debug(f"_ensure_voice_dependencies() returned: {dependencies_ok}")
+        log_debug("_ensure_voice_dependencies() returned: %s", dependencies_ok)
         
         clients_ok = False  # Assume false until proven true
         if dependencies_ok:  # Only try to init clients if dependencies are there
             clients_ok = _init_openai_clients_for_tts()
-            log_debug(f"_init_openai_clients_for_tts() returned: {clients_ok}")
+            log_debug("_init_openai_clients_for_tts() returned: %s", clients_ok)
         else:
             log_warning("Skipped OpenAI client init for TTS because voice dependencies are missing.")
 
@@ -356,7 +541,6 @@ async def fully_initialize_app_components():
             log_router_activity("TTS for text mode enabled at startup via --speak flag.")
             # If it wasn't, there's a logic error there. For now, let's re-affirm if --speak is true.
             if PARSED_ARGS.speak:  # Re-check here to be absolutely sure if all checks passed.
-                from .cli_args import TEXT_MODE_TTS_ENABLED
                 log_router_activity("Setting TEXT_MODE_TTS_ENABLED to True based on --speak flag")
             else:  # Should not happen if PARSED_ARGS.speak was the entry condition for this block.
                 log_warning("Logic error: TTS enablement block entered without --speak flag being true initially.")
@@ -378,31 +562,33 @@ async def fully_initialize_app_components():
             mcp_requirements, 
             should_start_profile_mcp, 
             should_start_workflow_mcp,
-            verbose=getattr(PARSED_ARGS, 'verbose', False)
+            verbose=_VERBOSE
         )
         
-        # Conditionally start Profile MCP Server
+        # Conditionally start the Profile and Workflow MCP Servers; they bind
+        # independent ports, so their startups can overlap
+        server_startups = []
         if should_start_profile_mcp:
-            await _start_profile_mcp_server()
-        
-        # Conditionally start Workflow MCP Server
+            server_startups.append(_start_profile_mcp_server())
         if should_start_workflow_mcp:
-            await _start_workflow_mcp_server()
+            server_startups.append(_start_workflow_mcp_server())
+        await asyncio.gather(*server_startups, return_exceptions=True)
             
     except Exception as e:
         log_error(f"Failed to analyze MCP requirements, falling back to unconditional startup: {e}")
-        if getattr(PARSED_ARGS, 'verbose', False):
+        if _VERBOSE:
             print(f"Warning: MCP analysis failed, starting all servers: {e}")
         
         # Fallback to unconditional startup if analysis fails
         # Check session state to avoid double startup
-        from .session_state import get_current_session_state
         session_state = get_current_session_state()
         
+        server_startups = []
         if not PARSED_ARGS.no_profile_mcp_server and (not session_state or not session_state.profile_mcp_server_started):
-            await _start_profile_mcp_server()
+            server_startups.append(_start_profile_mcp_server())
         if not getattr(PARSED_ARGS, 'no_workflow_mcp_server', False) and (not session_state or not session_state.workflow_mcp_server_started):
-            await _start_workflow_mcp_server()
+            server_startups.append(_start_workflow_mcp_server())
+        await asyncio.gather(*server_startups, return_exceptions=True)
     
     if INITIAL_VOICE_MODE and TRIGGER_WORDS:
         log_router_activity(f"Voice mode starting with trigger words: {TRIGGER_WORDS}")
@@ -411,19 +597,20 @@ async def fully_initialize_app_components():
 
     # Setup workspace if specified
     workspace_path = None
-    if hasattr(PARSED_ARGS, 'workspace') and PARSED_ARGS.workspace:
+    workspace_arg = getattr(PARSED_ARGS, 'workspace', None)
+    if workspace_arg:
         try:
             # Resolve and setup workspace
-            workspace_path = workspace_manager.resolve_workspace_path(PARSED_ARGS.workspace)
+            workspace_path = workspace_manager.resolve_workspace_path(workspace_arg)
             original_cwd = workspace_manager.setup_workspace(workspace_path)
             log_router_activity(f"Workspace setup completed: {workspace_path}")
         except Exception as e:
-            log_error(f"Failed to setup workspace '{PARSED_ARGS.workspace}': {e}")
-            print(f"Warning: Failed to setup workspace '{PARSED_ARGS.workspace}': {e}")
+            log_error(f"Failed to setup workspace '{workspace_arg}': {e}")
+            print(f"Warning: Failed to setup workspace '{workspace_arg}': {e}")
             workspace_path = None
     
     # Initialize session state for initial profile
-    profile_name = PARSED_ARGS.profile if hasattr(PARSED_ARGS, 'profile') and PARSED_ARGS.profile else "default"
+    profile_name = _STARTUP_PROFILE
     log_router_activity(f"Using initial profile: {profile_name}")
     
     # Initialize session state
@@ -438,10 +625,13 @@ async def fully_initialize_app_components():
     
     # If a profile was specified, activate it
     if profile_name:
-        profile = profile_manager.get_profile(profile_name, resolve=True)
+        # Resolve with the same workspace variables activate_profile would use, so the
+        # startup profile matches what a later /profile switch produces
+        workspace_variables = workspace_manager.get_workspace_variables(workspace_path) if workspace_path else {}
+        profile = profile_manager.get_profile(profile_name, resolve=True, workspace_variables=workspace_variables)
         if profile:
             log_router_activity(f"Loading profile '{profile_name}' at startup")
-            activate_profile(profile_name, initial_session)
+            activate_profile(profile_name, initial_session, resolved_profile=profile)
 
     _APP_INITIALIZED = True
     log_router_activity("All application components initialized.")
@@ -453,9 +643,15 @@ async def run_cli_orchestrator():
     This handles the application's main loop, switching between text and voice modes,
     and processing user input through the assistant.
     """
+    # Only the interactive loop needs the prompt, voice and turn handlers, so
+    # non-interactive runs never import them
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.history import FileHistory
+    from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
+    from .interaction_handler import print_welcome_message, text_mode_one_turn
+    from .voice_handler import VoiceHandler
     
     # Initialize the global interrupt handler
-    global interrupt_handler
     interrupt_handler.initialize()
     
     # Register exit callback
@@ -465,39 +661,11 @@ async def run_cli_orchestrator():
     
     interrupt_handler.register_exit_callback(exit_application)
     
-    # Force re-installation of our signal handler in case asyncio overrode it
-    # This is a workaround for asyncio's signal handling behavior
-    signal.signal(signal.SIGINT, interrupt_handler._handle_interrupt)
-    
-    # Start a background task to periodically check and restore our signal handler
-    async def ensure_signal_handler():
-        """Periodically check and restore our signal handler if needed."""
-        while True:
-            try:
-                await asyncio.sleep(0.5)
-                current = signal.getsignal(signal.SIGINT)
-                if current != interrupt_handler._handle_interrupt:
-                    log_debug(f"Signal handler was changed to {current}, restoring...")
-                    signal.signal(signal.SIGINT, interrupt_handler._handle_interrupt)
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                log_debug(f"Error in ensure_signal_handler: {e}")
-    
-    # Start the signal handler checker and track it for cleanup
-    signal_handler_task = asyncio.create_task(ensure_signal_handler())
-    interrupt_handler.track_task(signal_handler_task)
-    
-    # Store for cleanup (using global to access in cleanup function)
-    global _signal_handler_task
-    _signal_handler_task = signal_handler_task
+    # No watchdog task is needed to keep the SIGINT handler installed: prompt_toolkit
+    # only swaps it out while a prompt is active, and InterruptHandler.set_context
+    # re-installs it on every context change (e.g. when Claude starts thinking)
     
-    # Determine the profile name for welcome message
-    profile_name = "default"
-    if hasattr(PARSED_ARGS, 'profile') and PARSED_ARGS.profile:
-        profile_name = PARSED_ARGS.profile
-    
-    print_welcome_message(profile_name)
+    print_welcome_message(_STARTUP_PROFILE)
     log_router_activity(f"Chat session started: {datetime.utcnow().strftime('%Y%m%d%H%M%S')}")
     
     # Initialize history file
@@ -532,10 +700,7 @@ async def run_cli_orchestrator():
             if hasattr(session_state, 'active_profile') and session_state.active_profile:
                 profile_name = session_state.active_profile.get("profile_name", "default")
                 
-            print_formatted_text(FormattedText([
-                ("bold fg:magenta", f"🎙️ Voice mode enabled with profile '{profile_name}'."), 
-                ("", " Say '/voice off' to switch to text. Ctrl+C to exit.")
-            ]), style=cli_style)
+            _print_styled(_voice_mode_banner(profile_name, " Say '/voice off' to switch to text. Ctrl+C to exit."))
         else: 
             log_error("[Orchestrator] Failed to initialize voice components for voice mode. Switching to text mode.")
             active_mode = 'text'
@@ -545,10 +710,7 @@ async def run_cli_orchestrator():
         if hasattr(session_state, 'active_profile') and session_state.active_profile:
             profile_name = session_state.active_profile.get("profile_name", "default")
             
-        print_formatted_text(FormattedText([
-            ("bold fg:green", f"⌨️ Text mode enabled with profile '{profile_name}'."), 
-            ("", " Type '/voice on' to switch or '/speak on' for TTS output. 'exit' or Ctrl+C to leave.")
-        ]), style=cli_style)
+        _print_styled(_text_mode_banner(profile_name))
 
     while True:
         action: str = 'continue'
@@ -558,26 +720,26 @@ async def run_cli_orchestrator():
                     prompt_session, session_state
                 )
                 # Update the global reference after session state changes
-                if session_state is not None and not isinstance(session_state, str):
+                if session_state is not None:
                     set_current_session_state(session_state)
             elif active_mode == 'voice':
                 # Disable TTS in text mode when in voice mode
-                from .cli_args import TEXT_MODE_TTS_ENABLED
-                TEXT_MODE_TTS_ENABLED = False 
+                cli_args.TEXT_MODE_TTS_ENABLED = False
                 
                 if not voice_handler.recorder_instance:
-                    print_formatted_text(FormattedText([
-                        ('class:error', "Error: Voice recorder not active! Switching to text mode.")
-                    ]), style=cli_style)
+                    _print_styled(_MSG_VOICE_RECORDER_INACTIVE)
                     active_mode = 'text'
                     action = 'switch_to_text' 
                 else:
                     action, session_state = await voice_handler.handle_one_turn(session_state)
                     # Update the global reference after session state changes
-                    if session_state is not None and not isinstance(session_state, str):
+                    if session_state is not None:
                         set_current_session_state(session_state)
         
         except asyncio.CancelledError: 
+            if _SHUTDOWN_REQUESTED:
+                log_router_activity("Chat session ended by SIGTERM.")
+                break
             log_warning("[Orchestrator] Turn was CANCELLED (asyncio.CancelledError).")
             # Potentially add cleanup for STT recorder if active_mode was voice
             if active_mode == 'voice':
@@ -586,304 +748,267 @@ async def run_cli_orchestrator():
             action = 'continue'  # Attempt to continue, might loop into text mode prompt
         except KeyboardInterrupt: 
             log_debug("[Orchestrator] CAUGHT KeyboardInterrupt during turn.")
-            print_formatted_text(FormattedText([
-                ('class:warning', "\n⚠️ Operation cancelled by user.")
-            ]), style=cli_style)
+            _print_styled(_MSG_OPERATION_CANCELLED)
             
             if active_mode == 'voice':
                 log_router_activity("[Orchestrator] KeyboardInterrupt in voice mode, attempting to switch to text mode immediately.")
                 voice_handler.shutdown()
                 active_mode = 'text'  # Force mode change
-                from .cli_args import TEXT_MODE_TTS_ENABLED
-                TEXT_MODE_TTS_ENABLED = False  # Disable TTS when falling back
+                cli_args.TEXT_MODE_TTS_ENABLED = False  # Disable TTS when falling back
                 action = 'show_text_prompt_after_interrupt'  # New distinct action
             else:
                 log_router_activity("[Orchestrator] KeyboardInterrupt in text mode, returning to prompt.")
                 action = 'continue'  # Continue in text mode (effectively new prompt)
         except Exception as e_orchestrator_loop:
             log_error(f"[Orchestrator] Unexpected error in main loop: {e_orchestrator_loop}", exception_info=str(e_orchestrator_loop))
-            print_formatted_text(FormattedText([
+            _print_styled(FormattedText([
                 ('class:error', f"\nUnexpected error in main loop: {e_orchestrator_loop}. Returning to prompt.")
-            ]), style=cli_style)
+            ]))
             
             if active_mode == 'voice':  # Attempt cleanup if error happened in voice mode
                 voice_handler.shutdown()
                 active_mode = 'text'  # Fallback to text mode
             action = 'continue'
 
+        # A turn handler may have swallowed the cancellation itself
+        if _SHUTDOWN_REQUESTED:
+            log_router_activity("Chat session ended by SIGTERM.")
+            break
+
         # --- Handle actions from turn handlers (or from KI override) ---
         if action == 'exit':
-            print_formatted_text(FormattedText([("bold", "\nExiting ARIS...")]), style=cli_style)
+            _print_styled(_MSG_EXITING)
             log_router_activity("Chat session ended by user command.")
             break
         elif action == 'new_conversation':
-            print_formatted_text(FormattedText([("bold", "✨ Starting a new conversation.")]), style=cli_style)
+            _print_styled(_MSG_NEW_CONVERSATION)
             log_router_activity("User started a new conversation session.")
             # Update the global reference for the new session
-            if session_state is not None and not isinstance(session_state, str):
+            if session_state is not None:
                 set_current_session_state(session_state)
         elif action == 'switch_to_voice':
             if active_mode == 'text':
                 if voice_handler.initialize():
                     active_mode = 'voice'
-                    from .cli_args import TEXT_MODE_TTS_ENABLED
-                    TEXT_MODE_TTS_ENABLED = False 
+                    cli_args.TEXT_MODE_TTS_ENABLED = False
                     log_router_activity("User switched to voice mode.")
                     
                     profile_name = "default"
                     if hasattr(session_state, 'active_profile') and session_state.active_profile:
                         profile_name = session_state.active_profile.get("profile_name", "default")
                         
-                    print_formatted_text(FormattedText([
-                        ("bold fg:magenta", f"🎙️ Voice mode enabled with profile '{profile_name}'."), 
-                        ("", " Say '/voice off' to switch. Ctrl+C to exit.")
-                    ]), style=cli_style)
+                    _print_styled(_voice_mode_banner(profile_name, " Say '/voice off' to switch. Ctrl+C to exit."))
                 else:
-                    print_formatted_text(FormattedText([
-                        ('class:error', f"Error initializing voice mode. Staying in text mode.")
-                    ]), style=cli_style)
+                    _print_styled(_MSG_VOICE_INIT_FAILED)
                     log_error(f"Error initializing voice mode. Staying in text mode.")
             else:
-                 print_formatted_text(FormattedText([
-                     ('class:error', "Cannot switch to voice mode due to missing dependencies or API key. Staying in text mode.")
-                 ]), style=cli_style)
+                 _print_styled(_MSG_VOICE_UNAVAILABLE)
         elif action == 'switch_to_text':
             if active_mode == 'voice':
                 voice_handler.shutdown()
                 active_mode = 'text'
                 log_router_activity("User switched to text mode.")
                 
-                status_msg = "⌨️ Text mode enabled." 
-                if TEXT_MODE_TTS_ENABLED:
-                    status_msg += " TTS is ON ('/speak off' to disable)."
-                else:
-                    status_msg += " Type '/voice on' to switch or '/speak on' for TTS output."
-                status_msg += " 'exit' or Ctrl+C to leave."
-                
-                print_formatted_text(FormattedText([
-                    ("bold fg:green", status_msg)
-                ]), style=cli_style)
+                _print_styled(_MSG_TEXT_MODE_TTS_ON if cli_args.TEXT_MODE_TTS_ENABLED else _MSG_TEXT_MODE_TTS_OFF)
         elif action == 'show_text_prompt_after_interrupt':
             # This state is specifically after a KI in voice mode.
             # Ensure text mode UI is clearly re-established.
             active_mode = 'text'  # Re-affirm, though should already be set
             # Ensure any active spinner is stopped from the interrupted turn
-            print_formatted_text(FormattedText([
-                ("bold fg:green", "\n⌨️ Switched to text mode. Type 'exit' or Ctrl+C to leave.")
-            ]), style=cli_style)
+            _print_styled(_MSG_SWITCHED_TO_TEXT_MODE)
             # Loop will continue and text_mode_one_turn will be called to show prompt
 
     # --- Cleanup ---
-    # Clean up MCP servers first (before other cleanup)
-    await _shutdown_mcp_servers()
-    
-    # Cancel signal handler task if it exists
-    if _signal_handler_task and not _signal_handler_task.done():
-        _signal_handler_task.cancel()
-        try:
-            await _signal_handler_task
-        except asyncio.CancelledError:
-            log_debug("Signal handler task cancelled successfully")
-    
-    voice_handler.shutdown()
-    
-    # Clean up interrupt handler
+    # MCP server shutdown, the voice recorder teardown and the old context file
+    # sweep are independent and mostly waiting on I/O, so overlap them. The
+    # blocking ones run in worker threads to keep the loop free for the servers.
+    cleanup_steps = {
+        "_shutdown_mcp_servers": _shutdown_mcp_servers(),
+        "voice_handler.shutdown": asyncio.to_thread(voice_handler.shutdown),
+        "cleanup_old_files": asyncio.to_thread(context_file_manager.cleanup_old_files),
+    }
+    cleanup_results = await asyncio.gather(*cleanup_steps.values(), return_exceptions=True)
+    for step_name, result in zip(cleanup_steps, cleanup_results):
+        if isinstance(result, BaseException):
+            log_error(f"[Orchestrator] Cleanup step {step_name} failed: {result}", exception_info=repr(result))
+    
+    # Clean up interrupt handler (restores the SIGINT handler, so it stays on the main thread)
     interrupt_handler.shutdown()
     
-    # Clean up context file manager
-    from .context_file_manager import context_file_manager
-    context_file_manager.cleanup_old_files()
-    
     # Restore original directory if workspace was used
     workspace_manager.restore_original_directory()
     
-    print_formatted_text("-----------------------------------------------------", style=cli_style)
+    _print_styled("-----------------------------------------------------")
 
 
 async def _shutdown_mcp_servers():
     """Gracefully shutdown MCP servers to prevent port binding issues."""
     global _workflow_mcp_server_started, _profile_mcp_server_started
-    global _workflow_mcp_server_thread, _profile_mcp_server_thread
+    global _workflow_uv_server, _profile_uv_server
+    global _workflow_mcp_task, _profile_mcp_task
     
     shutdown_tasks = []
     
     # Shutdown workflow MCP server
-    if _workflow_mcp_server_started and _workflow_mcp_server_thread:
+    if _workflow_mcp_server_started and _workflow_uv_server:
         log_debug("Shutting down Workflow MCP Server...")
-        try:
-            # Give the server thread a moment to cleanup
-            # Note: Since these are daemon threads running uvicorn, they will
-            # terminate when the main process exits, but we still track the state
-            _workflow_mcp_server_started = False
-            # The daemon thread will be terminated by Python when main process exits
-        except Exception as e:
-            log_error(f"Error shutting down Workflow MCP Server: {e}")
+        # Ask uvicorn's main loop to exit; the serve() task then closes its sockets
+        _workflow_uv_server.should_exit = True
+        if _workflow_mcp_task:
+            shutdown_tasks.append(_workflow_mcp_task)
+        _workflow_mcp_server_started = False
     
     # Shutdown profile MCP server  
-    if _profile_mcp_server_started and _profile_mcp_server_thread:
+    if _profile_mcp_server_started and _profile_uv_server:
         log_debug("Shutting down Profile MCP Server...")
-        try:
-            _profile_mcp_server_started = False
-            # The daemon thread will be terminated by Python when main process exits
-        except Exception as e:
-            log_error(f"Error shutting down Profile MCP Server: {e}")
-    
-    # Small delay to allow socket cleanup before process exit
-    if shutdown_tasks or _workflow_mcp_server_started or _profile_mcp_server_started:
-        await asyncio.sleep(0.1)
+        _profile_uv_server.should_exit = True
+        if _profile_mcp_task:
+            shutdown_tasks.append(_profile_mcp_task)
+        _profile_mcp_server_started = False
+    
+    # Wait for the serve() tasks to finish so the ports are released before exit.
+    # uvicorn forces open connections closed after its graceful timeout; the extra
+    # second only guards against a server that never reaches its shutdown step,
+    # whose task is then cancelled explicitly rather than left for interpreter exit.
+    if shutdown_tasks:
+        _, pending = await asyncio.wait(shutdown_tasks, timeout=_MCP_GRACEFUL_SHUTDOWN_TIMEOUT + 1)
+        if pending:
+            log_warning("Cancelling %d MCP server task(s) that did not shut down in time", len(pending))
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+    
+    _workflow_uv_server = _profile_uv_server = None
+    _workflow_mcp_task = _profile_mcp_task = None
     
     log_debug("MCP server shutdown completed")
 
 
+class _InProcessUvicornServer(uvicorn.Server):
+    """uvicorn server that runs on the CLI's event loop without taking over signals.
+    
+    SIGINT belongs to the InterruptHandler, so uvicorn must not install its own
+    handlers (``install_signal_handlers`` on older uvicorn, ``capture_signals`` on newer).
+    """
+    
+    def __init__(self, config: uvicorn.Config):
+        super().__init__(config)
+        # Set once the listening sockets are bound, so startup can be awaited
+        self.ready = asyncio.Event()
+    
+    async def startup(self, sockets=None) -> None:
+        await super().startup(sockets=sockets)
+        if self.started:
+            self.ready.set()
+    
+    def install_signal_handlers(self) -> None:
+        pass
+    
+    def capture_signals(self):
+        return contextlib.nullcontext()
+
+
+async def _serve_uvicorn(uv_server: uvicorn.Server):
+    """Run ``uv_server`` until it exits, turning uvicorn's startup sys.exit into an error."""
+    try:
+        await uv_server.serve()
+    except SystemExit as e:
+        # uvicorn calls sys.exit(1) when it cannot bind (e.g. address already in use)
+        raise RuntimeError(f"uvicorn exited during startup (code {e.code})") from None
+
+
+async def _start_uvicorn_task(app, host: str, port: int, startup_timeout: float):
+    """
+    Start ``app`` under uvicorn as a task on the running event loop.
+    
+    Returns ``(uv_server, task)`` once uvicorn reports it is listening.
+    Raises RuntimeError if the server fails or does not come up within ``startup_timeout``.
+    """
+    config = uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        log_level="warning",
+        # Access log disabled to reduce noise
+        access_log=False,
+        # Bound how long open (e.g. SSE) connections can hold up shutdown
+        timeout_graceful_shutdown=_MCP_GRACEFUL_SHUTDOWN_TIMEOUT
+    )
+    uv_server = _InProcessUvicornServer(config)
+    task = asyncio.create_task(_serve_uvicorn(uv_server))
+    
+    # Wake on whichever comes first: the server binding, or serve() ending early
+    ready_waiter = asyncio.create_task(uv_server.ready.wait())
+    await asyncio.wait({ready_waiter, task}, timeout=startup_timeout, return_when=asyncio.FIRST_COMPLETED)
+    
+    if not uv_server.ready.is_set():
+        ready_waiter.cancel()
+        if task.done():
+            error = task.exception()
+            raise RuntimeError(str(error) if error else f"server on port {port} stopped during startup")
+        uv_server.should_exit = True
+        raise RuntimeError(f"server on port {port} did not start within {startup_timeout:.0f}s")
+    
+    return uv_server, task
+
+
+def _mark_mcp_started(kind: str, port: int, session_attr: str) -> None:
+    """Record a successful MCP server start in the log, the session state and (if verbose) the console."""
+    log_router_activity("Started %s MCP Server on port %s", kind, port)
+    
+    session_state = get_current_session_state()
+    if session_state:
+        setattr(session_state, session_attr, True)
+    
+    # Only print info to console if verbose mode is enabled
+    if _VERBOSE:
+        print(f"{kind} MCP Server started on http://localhost:{port}")
+
+
 async def _start_profile_mcp_server():
     """Start the Profile MCP Server."""
     try:
-        from .profile_mcp_server import ProfileMCPServer
-        
-        # Create an event to signal when the server is ready
-        server_ready_event = threading.Event()
-        server_error_msg = [None]  # Use a list to store error message by reference
-        
-        # Define a function to run the server and set the event when ready
-        def run_server_with_signal(server, ready_event, error_msg):
-            try:
-                # Run the server - this method should handle port collision and other errors
-                server.run_server_blocking()
-            except Exception as e:
-                error_msg[0] = str(e)
-            finally:
-                # Signal that we're done trying to start the server
-                ready_event.set()
-        
-        # Start the MCP server in a separate thread
         mcp_server = ProfileMCPServer(port=PARSED_ARGS.profile_mcp_port)
-        global _profile_mcp_server_thread
-        _profile_mcp_server_thread = threading.Thread(
-            target=run_server_with_signal, 
-            args=(mcp_server, server_ready_event, server_error_msg),
-            daemon=True
-        )
-        _profile_mcp_server_thread.start()
+        # Register tools before the app starts accepting connections
+        await mcp_server.start_server_async()
         
-        # Wait for up to 5 seconds for the server to start
-        server_ready = server_ready_event.wait(5.0)
+        global _profile_uv_server, _profile_mcp_task
+        _profile_uv_server, _profile_mcp_task = await _start_uvicorn_task(
+            mcp_server.starlette_app, mcp_server.host, mcp_server.port, startup_timeout=5.0
+        )
         
-        if server_error_msg[0]:
-            # Server encountered an error
-            log_error(f"Failed to start Profile MCP Server: {server_error_msg[0]}")
-            if getattr(PARSED_ARGS, 'verbose', False):
-                print(f"Warning: Failed to start Profile MCP Server: {server_error_msg[0]}")
-        else:
-            # Server started successfully
-            log_router_activity(f"Started Profile MCP Server on port {mcp_server.port}")
-            
-            # Mark server as started globally and in session state
-            global _profile_mcp_server_started
-            _profile_mcp_server_started = True
-            
-            from .session_state import get_current_session_state
-            session_state = get_current_session_state()
-            if session_state:
-                session_state.profile_mcp_server_started = True
-            
-            # Only print info to console if verbose mode is enabled
-            if getattr(PARSED_ARGS, 'verbose', False):
-                print(f"Profile MCP Server started on http://localhost:{mcp_server.port}")
+        # Mark server as started globally and in session state
+        global _profile_mcp_server_started
+        _profile_mcp_server_started = True
+        _mark_mcp_started("Profile", mcp_server.port, "profile_mcp_server_started")
     except Exception as e:
         log_error(f"Failed to start Profile MCP Server: {e}")
-        if getattr(PARSED_ARGS, 'verbose', False):
+        if _VERBOSE:
             print(f"Warning: Failed to start Profile MCP Server: {e}")
 
 
 async def _start_workflow_mcp_server():
     """Start the Workflow MCP Server."""
     try:
-        from .workflow_mcp_server import WorkflowMCPServer
-        
-        # Create an event to signal when the server is ready
-        workflow_server_ready_event = threading.Event()
-        workflow_server_error_msg = [None]  # Use a list to store error message by reference
-        
-        # Define a function to run the server and set the event when ready
-        def run_workflow_server_with_signal(server, ready_event, error_msg):
-            try:
-                import uvicorn
-                import socket
-                import os
-                
-                # Set environment variable to enable socket reuse in uvicorn
-                os.environ.setdefault('UVICORN_SERVER_SOCKET_REUSE', '1')
-                
-                # Configure uvicorn with proper socket options for faster cleanup
-                uvicorn.run(
-                    server.starlette_app,
-                    host=server.host,
-                    port=server.port,
-                    log_level="warning",
-                    # Access log disabled to reduce noise
-                    access_log=False
-                )
-                
-            except Exception as e:
-                error_msg[0] = str(e)
-            finally:
-                # Signal that we're done trying to start the server
-                ready_event.set()
-        
-        # Start the Workflow MCP server in a separate thread
         workflow_mcp_server = WorkflowMCPServer(port=8095)
-        global _workflow_mcp_server_thread
-        _workflow_mcp_server_thread = threading.Thread(
-            target=run_workflow_server_with_signal, 
-            args=(workflow_mcp_server, workflow_server_ready_event, workflow_server_error_msg),
-            daemon=True
-        )
-        _workflow_mcp_server_thread.start()
         
-        # Wait for up to 3 seconds for the server to start
-        workflow_server_ready = workflow_server_ready_event.wait(3.0)
+        global _workflow_uv_server, _workflow_mcp_task
+        _workflow_uv_server, _workflow_mcp_task = await _start_uvicorn_task(
+            workflow_mcp_server.starlette_app, workflow_mcp_server.host, workflow_mcp_server.port, startup_timeout=3.0
+        )
         
-        if workflow_server_error_msg[0]:
-            # Server encountered an error
-            log_error(f"Failed to start Workflow MCP Server: {workflow_server_error_msg[0]}")
-            if getattr(PARSED_ARGS, 'verbose', False):
-                print(f"Warning: Failed to start Workflow MCP Server: {workflow_server_error_msg[0]}")
-        else:
-            # Server started successfully
-            log_router_activity(f"Started Workflow MCP Server on port {workflow_mcp_server.port}")
-            
-            # Mark server as started globally and in session state
-            global _workflow_mcp_server_started
-            _workflow_mcp_server_started = True
-            
-            from .session_state import get_current_session_state
-            session_state = get_current_session_state()
-            if session_state:
-                session_state.workflow_mcp_server_started = True
-            
-            # Only print info to console if verbose mode is enabled
-            if getattr(PARSED_ARGS, 'verbose', False):
-                print(f"Workflow MCP Server started on http://localhost:{workflow_mcp_server.port}")
+        # Mark server as started globally and in session state
+        global _workflow_mcp_server_started
+        _workflow_mcp_server_started = True
+        _mark_mcp_started("Workflow", workflow_mcp_server.port, "workflow_mcp_server_started")
     except Exception as e:
         log_error(f"Failed to start Workflow MCP Server: {e}")
-        if getattr(PARSED_ARGS, 'verbose', False):
+        if _VERBOSE:
             print(f"Warning: Failed to start Workflow MCP Server: {e}")
 
 
 # The main execution block
 if __name__ == "__main__":
-    # Parse arguments and configure logging
-    initialize_environment()
-    
-    # Now, perform full application component initialization
-    asyncio.run(fully_initialize_app_components())
-    
-    try:
-        asyncio.run(run_cli_orchestrator())
-    except KeyboardInterrupt:
-        print_formatted_text(FormattedText([
-            ("bold", "\nExiting ARIS via Ctrl+C...")
-        ]), style=cli_style)
-        log_router_activity("Chat session ended by KeyboardInterrupt.")
-    finally:
-        pass
\ No newline at end of file
+    # Share the console entry point so signal handling and MCP server cleanup match `python -m aris`
+    from aris.__main__ import main
+    main()
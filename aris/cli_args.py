@@ -10,6 +10,8 @@ from typing import Dict, Any
 from dotenv import load_dotenv, find_dotenv
 
 from .logging_utils import (
+    DEBUG,
+    INFO,
     configure_logging,
     log_router_activity,
     log_error,
@@ -24,6 +26,9 @@ TEXT_MODE_TTS_ENABLED = False
 # Parsed command-line arguments
 PARSED_ARGS = None
 
+# argparse prints usage and exits on these before any configuration is read
+_HELP_FLAGS = frozenset(("-h", "--help"))
+
 def parse_arguments_and_configure_logging():
     """
     Parses CLI arguments and configures logging.
@@ -42,7 +47,7 @@ def parse_arguments_and_configure_logging():
     parser.add_argument(
         "--verbose", 
         action="store_true", 
-        help="Enable verbose logging to the console."
+        help="Enable verbose logging to the console, including debug messages."
     )
     parser.add_argument(
         "--log-file", 
@@ -86,7 +91,6 @@ def parse_arguments_and_configure_logging():
     # Resolve workspace path if provided for logging configuration
     workspace_path = None
     if args.workspace:
-        from pathlib import Path
         if Path(args.workspace).is_absolute():
             workspace_path = str(Path(args.workspace).resolve())
         else:
@@ -96,7 +100,9 @@ def parse_arguments_and_configure_logging():
     configure_logging(
         enable_console_logging=args.verbose,
         log_file_path=args.log_file,
-        workspace_path=workspace_path
+        workspace_path=workspace_path,
+        # Debug records are only formatted and written for --verbose runs
+        min_level=DEBUG if args.verbose else INFO
     )
     
     log_router_activity(f"ARIS logging initialized with timestamped log file")
@@ -106,7 +112,8 @@ def parse_arguments_and_configure_logging():
         INITIAL_VOICE_MODE = True
     if args.speak:
         TEXT_MODE_TTS_ENABLED = True
-    TRIGGER_WORDS = [w.strip().lower() for w in args.trigger_words.split(',') if w.strip()]
+    # Lowercase the whole list once, then strip each word a single time
+    TRIGGER_WORDS = [w for w in (part.strip() for part in args.trigger_words.lower().split(',')) if w]
 
     return args
 
@@ -114,8 +121,14 @@ def initialize_environment():
     """Initialize environment variables and logging."""
     global PARSED_ARGS
     
-    # Load environment variables from .env file
-    _ = load_dotenv(find_dotenv())
+    # Arguments, logging and .env are process-wide; a repeated call reuses the first result
+    if PARSED_ARGS is not None:
+        return PARSED_ARGS
+    
+    # Load environment variables from .env file; --help never reads them, so skip
+    # find_dotenv's walk up the directory tree
+    if _HELP_FLAGS.isdisjoint(sys.argv[1:]):
+        _ = load_dotenv(find_dotenv())
     
     # Parse arguments and configure logging
     PARSED_ARGS = parse_arguments_and_configure_logging()
@@ -1,8 +1,11 @@
+import json
 import os
-from typing import List, Dict, Set, Optional, Any
+import sys
+from typing import List, Dict, Set, FrozenSet, Optional, Any
 
 # Assuming logging_utils is in the same directory or accessible via Python path
 from .logging_utils import log_router_activity, log_warning, log_debug
+from .session_state import get_current_session_state
 
 class CLIFlagManager:
     """
@@ -12,11 +15,15 @@ class CLIFlagManager:
     - MCP configuration
     """
     
-    USER_DESIRED_NON_MCP_TOOLS: List[str] = [
+    USER_DESIRED_NON_MCP_TOOLS: FrozenSet[str] = frozenset({
         "Task", "Glob", "Grep", "LS", "Read", "Edit", "MultiEdit", "Write",
         "NotebookRead", "NotebookEdit", "WebFetch", "Batch", "TodoRead", "TodoWrite", "WebSearch",
         "Bash"  # All Bash commands - native Claude Code tools that should never get MCP prefixes
-    ]
+    })
+    
+    # "Bash" only marks Bash commands as native; the commands themselves are added
+    # via tool preferences, so the entry itself is never passed to --allowedTools
+    _NON_MCP_MARKERS: FrozenSet[str] = frozenset({"Bash"})
     
     # Dynamic server prefix format instead of hardcoded prefix
     MCP_SERVER_PREFIX_FORMAT: str = "mcp__{server_name}__"
@@ -50,12 +57,60 @@ class CLIFlagManager:
         # Initialize MCP config data for tool resolution
         self._current_mcp_config_data = None
         
+        # Merged MCP config path for the active profile object, as (profile, path)
+        self._profile_mcp_config_cache: Optional[tuple] = None
+        
+        # Formatted MCP_SERVER_PREFIX_FORMAT per server name
+        self._server_prefixes: Dict[str, str] = {}
+        
+        # Parsed MCP config files by absolute path, as ((mtime_ns, size), data)
+        self._mcp_config_file_cache: Dict[str, tuple] = {}
+        
         log_debug(f"CLIFlagManager initialized. Script directory: {self.script_dir}")
 
     def _get_mcp_config_path(self) -> Optional[str]:
         """Returns None to indicate no default MCP config file should be used."""
         return None
 
+    def _server_prefix(self, server_name: str) -> str:
+        """Returns the mcp__<server>__ prefix for a server, formatting it only once."""
+        prefix = self._server_prefixes.get(server_name)
+        if prefix is None:
+            prefix = self._server_prefixes[server_name] = self.MCP_SERVER_PREFIX_FORMAT.format(server_name=server_name)
+        return prefix
+
+    def _load_mcp_config_file(self, config_path: str) -> Dict:
+        """
+        Returns the parsed MCP config file, reading and decoding it again only when
+        its modification time or size has changed since the last call.
+        """
+        stat_result = os.stat(config_path)
+        signature = (stat_result.st_mtime_ns, stat_result.st_size)
+        cached = self._mcp_config_file_cache.get(config_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        with open(config_path, 'r') as f:
+            config_data = json.load(f)
+        self._mcp_config_file_cache[config_path] = (signature, config_data)
+        return config_data
+
+    def _get_profile_mcp_config_path(self, profile: Dict) -> Optional[str]:
+        """
+        Returns the merged MCP config path for a profile, merging it only once per profile.
+        
+        The session keeps the same profile dict until another profile is activated, so
+        identity is enough to tell whether the previously merged file still applies.
+        """
+        cached = self._profile_mcp_config_cache
+        if cached is not None and cached[0] is profile and (cached[1] is None or os.path.exists(cached[1])):
+            return cached[1]
+        
+        from .profile_manager import profile_manager
+        mcp_config_path = profile_manager.get_merged_mcp_config_path(profile)
+        self._profile_mcp_config_cache = (profile, mcp_config_path)
+        return mcp_config_path
+
     def generate_claude_cli_flags(
         self, 
         mcp_tools_schema: List[Dict], 
@@ -85,7 +140,7 @@ class CLIFlagManager:
         # Store MCP config data for tool resolution
         if mcp_config_data:
             self._current_mcp_config_data = mcp_config_data
-            log_debug(f"CLIFlagManager: Stored MCP config data with servers: {list(mcp_config_data.get('mcpServers', {}).keys())}")
+            log_debug("CLIFlagManager: Stored MCP config data with servers: %s", list(mcp_config_data.get('mcpServers', {})))
         
         flags: List[str] = [
             self.OUTPUT_FORMAT_FLAG, self.OUTPUT_FORMAT_VALUE,
@@ -120,57 +175,43 @@ class CLIFlagManager:
                         log_debug(f"CLIFlagManager: Using already prefixed tool: {tool_name}")
                     else:
                         # Apply server-specific prefix
-                        prefixed_name = self.MCP_SERVER_PREFIX_FORMAT.format(server_name=server_name) + tool_name
+                        prefixed_name = self._server_prefix(server_name) + tool_name
                         final_tools_for_claude_cli.add(prefixed_name)
                         log_debug(f"CLIFlagManager: Added MCP tool with prefix: {tool_name} -> {prefixed_name}")
         
-        # Add non-MCP tools
-        for tool_name in self.USER_DESIRED_NON_MCP_TOOLS:
-            # Special handling for "Bash" - it represents all Bash commands
-            if tool_name == "Bash":
-                # Don't add "Bash" itself, as Bash commands are added via tool preferences
-                # This entry just ensures Bash commands are recognized as non-MCP tools
-                continue
-                
-            # Extract server names from tools we already have to avoid hardcoding
-            available_servers = set()
-            for existing_tool in final_tools_for_claude_cli:
-                if existing_tool.startswith("mcp__") and "__" in existing_tool:
-                    parts = existing_tool.split("__")
-                    if len(parts) > 2:
-                        server_name = parts[1]
-                        available_servers.add(server_name)
-            
-            # Check if it might be an MCP tool that already has a prefix
-            is_already_mcp = False
-            for server_name in available_servers:
-                server_prefix = self.MCP_SERVER_PREFIX_FORMAT.format(server_name=server_name)
-                if server_prefix + tool_name in final_tools_for_claude_cli:
-                    is_already_mcp = True
-                    break
-            
-            if not is_already_mcp:
-                final_tools_for_claude_cli.add(tool_name)
+        # Index the MCP tools by server name in one pass; the non-MCP tools added
+        # below never carry the mcp__ prefix, so the index stays valid afterwards
+        server_to_tools: Dict[str, List[str]] = {}
+        for existing_tool in final_tools_for_claude_cli:
+            if existing_tool.startswith("mcp__"):
+                server_name, sep, suffix = existing_tool[5:].partition("__")
+                if sep:
+                    server_to_tools.setdefault(server_name, []).append(existing_tool)
+        available_servers = server_to_tools.keys()
+        
+        # Map each bare tool name to its prefixed form, taking the first server
+        # (in server order) that provides it
+        tool_by_suffix: Dict[str, str] = {}
+        for server_name, server_tools in server_to_tools.items():
+            prefix_len = len(self._server_prefix(server_name))
+            for server_tool in server_tools:
+                tool_by_suffix.setdefault(server_tool[prefix_len:], server_tool)
+        
+        # Add non-MCP tools, except those some server already provides as a prefixed MCP tool
+        final_tools_for_claude_cli.update(
+            self.USER_DESIRED_NON_MCP_TOOLS.difference(tool_by_suffix, self._NON_MCP_MARKERS)
+        )
         
         # Apply tool preferences if provided
         if tool_preferences and len(tool_preferences) > 0:
             # Filter the tools based on preferences
             filtered_tools = set()
             
-            # First, extract all server names from available tools to avoid hardcoding
-            available_servers = set()
-            for tool in final_tools_for_claude_cli:
-                if tool.startswith("mcp__") and "__" in tool:
-                    parts = tool.split("__")
-                    if len(parts) > 2:
-                        server_name = parts[1]
-                        available_servers.add(server_name)
-            
-            log_debug(f"CLIFlagManager: Detected server names in available tools: {available_servers}")
+            log_debug("CLIFlagManager: Detected server names in available tools: %s", set(available_servers))
             
             # When debugging tool preferences, log everything
-            log_debug(f"CLIFlagManager: Processing tool preferences: {tool_preferences}")
-            log_debug(f"CLIFlagManager: Available tools before filtering: {final_tools_for_claude_cli}")
+            log_debug("CLIFlagManager: Processing tool preferences: %s", tool_preferences)
+            log_debug("CLIFlagManager: Available tools before filtering: %s", final_tools_for_claude_cli)
             
             for pref in tool_preferences:
                 # Check for exact match (including prefixed tools)
@@ -193,49 +234,24 @@ class CLIFlagManager:
                 
                 # Special handling for specific server preferences like "youtube"
                 if pref.lower() in available_servers:
-                    server_tools = [tool for tool in final_tools_for_claude_cli 
-                                   if tool.startswith(f"mcp__{pref.lower()}__")]
+                    server_tools = server_to_tools[pref.lower()]
                     filtered_tools.update(server_tools)
-                    log_debug(f"CLIFlagManager: Added all tools from server '{pref}': {server_tools}")
+                    log_debug("CLIFlagManager: Added all tools from server '%s': %s", pref, server_tools)
                     continue
                 
-                # Handle multi-part tool names like 'mcp__youtube__videos__getVideo'
-                if pref.startswith("mcp__") and "__" in pref:
-                    # Find tools that match the pattern 
-                    parts = pref.split("__")
-                    if len(parts) > 2:
-                        server_name = parts[1]
-                        # Look for tools from this server
-                        matching_tools = []
-                        for tool in final_tools_for_claude_cli:
-                            if tool.startswith(f"mcp__{server_name}__"):
-                                # For exact match on full tool name
-                                if tool == pref:
-                                    matching_tools.append(tool)
-                                # For match on the last part (e.g., getVideo)
-                                elif len(parts) > 3 and tool.endswith(f"__{parts[-1]}"):
-                                    matching_tools.append(tool)
-                        
-                        if matching_tools:
-                            filtered_tools.update(matching_tools)
-                            log_debug(f"CLIFlagManager: Added matching server tools: {matching_tools}")
-                            continue
-                
                 # Check if a full prefixed version of this tool exists
                 found_prefixed = False
-                for server_name in available_servers:
-                    prefixed = self.MCP_SERVER_PREFIX_FORMAT.format(server_name=server_name) + pref
-                    if prefixed in final_tools_for_claude_cli:
-                        filtered_tools.add(prefixed)
-                        log_debug(f"CLIFlagManager: Added prefixed tool: {prefixed}")
-                        found_prefixed = True
-                        break
+                prefixed = tool_by_suffix.get(pref)
+                if prefixed is not None:
+                    filtered_tools.add(prefixed)
+                    log_debug(f"CLIFlagManager: Added prefixed tool: {prefixed}")
+                    found_prefixed = True
                 
                 # Try to resolve tool preferences using MCP config information
                 if not found_prefixed and hasattr(self, '_current_mcp_config_data') and self._current_mcp_config_data:
                     mcp_servers = self._current_mcp_config_data.get('mcpServers', {})
                     for server_name in mcp_servers.keys():
-                        potential_mcp_tool = f"mcp__{server_name}__{pref}"
+                        potential_mcp_tool = self._server_prefix(server_name) + pref
                         # Add the potential MCP tool even if not in final_tools_for_claude_cli
                         # because MCP tools are loaded after CLI flags are generated
                         filtered_tools.add(potential_mcp_tool)
@@ -254,15 +270,17 @@ class CLIFlagManager:
             # Use filtered tools if we found matches, otherwise keep all tools
             if filtered_tools:
                 final_tools_for_claude_cli = filtered_tools
-                log_debug(f"CLIFlagManager: Filtered tools based on preferences: {filtered_tools}")
+                log_debug("CLIFlagManager: Filtered tools based on preferences: %s", filtered_tools)
         
-        # Add the allowedTools flag
-        final_tools_list = sorted(list(final_tools_for_claude_cli))
-        log_router_activity(f"CLIFlagManager: Final tools for Claude CLI {self.ALLOWED_TOOLS_FLAG}: {final_tools_list}")
+        # Add the allowedTools flag; sorted so the Claude CLI command line is the same
+        # from turn to turn for the same tool set
+        final_tools_list = sorted(final_tools_for_claude_cli)
+        log_router_activity("CLIFlagManager: Final tools for Claude CLI %s: %s", self.ALLOWED_TOOLS_FLAG, final_tools_list)
 
         if final_tools_list:
-            flags.extend([self.ALLOWED_TOOLS_FLAG, ",".join(final_tools_list)])
-            log_router_activity(f"CLIFlagManager: Shared flags include {self.ALLOWED_TOOLS_FLAG}: {','.join(final_tools_list)}")
+            allowed_tools_value = ",".join(final_tools_list)
+            flags.extend([self.ALLOWED_TOOLS_FLAG, allowed_tools_value])
+            log_router_activity("CLIFlagManager: Shared flags include %s: %s", self.ALLOWED_TOOLS_FLAG, allowed_tools_value)
         else:
             log_router_activity("CLIFlagManager: No tools for --allowedTools flag based on combined logic.")
         
@@ -289,12 +307,14 @@ class CLIFlagManager:
                     if os.access(mcp_config_abs_path, os.R_OK):
                         log_router_activity(f"CLIFlagManager: MCP config file is readable")
                         
-                        # Read file content to verify it's a valid JSON
+                        # Read file content to verify it's a valid JSON, unless the caller
+                        # already parsed this file and passed the result in
                         try:
-                            import json
-                            with open(mcp_config_abs_path, 'r') as f:
-                                json_content = json.load(f)
-                            log_router_activity(f"CLIFlagManager: MCP config file contains valid JSON with keys: {list(json_content.keys())}")
+                            if mcp_config_data:
+                                json_content = mcp_config_data
+                            else:
+                                json_content = self._load_mcp_config_file(mcp_config_abs_path)
+                            log_router_activity("CLIFlagManager: MCP config file contains valid JSON with keys: %s", list(json_content))
                             
                             # Store MCP config data for tool resolution
                             self._current_mcp_config_data = json_content
@@ -338,7 +358,6 @@ class CLIFlagManager:
             log_router_activity(f"CLIFlagManager: No MCP config path provided, skipping {self.MCP_CONFIG_FLAG}")
             
             # Check if we're in a test environment - tests expect no MCP config by default
-            import sys
             in_pytest = 'pytest' in sys.modules
             if in_pytest:
                 log_router_activity(f"CLIFlagManager: Running in pytest, skipping automatic MCP config")
@@ -346,17 +365,15 @@ class CLIFlagManager:
                 # Not in a test environment, try to find an appropriate MCP config
                 try:
                     # Get the current profile from the session state
-                    from .cli import get_current_session_state
                     session_state = get_current_session_state()
                     
                     if session_state and hasattr(session_state, 'active_profile') and session_state.active_profile:
                         # Get MCP config from the active profile
-                        from .profile_manager import profile_manager
                         profile = session_state.active_profile
                         profile_name = profile.get('profile_name', 'unknown')
                         
                         log_router_activity(f"CLIFlagManager: Getting MCP config for active profile: {profile_name}")
-                        mcp_config_path = profile_manager.get_merged_mcp_config_path(profile)
+                        mcp_config_path = self._get_profile_mcp_config_path(profile)
                         
                         if mcp_config_path and os.path.exists(mcp_config_path):
                             log_router_activity(f"CLIFlagManager: Found MCP config for profile {profile_name} at: {mcp_config_path}")
@@ -376,7 +393,7 @@ class CLIFlagManager:
                     log_warning(f"CLIFlagManager: Error getting MCP config: {e}")
                     log_router_activity(f"CLIFlagManager: No MCP config path provided or found, skipping {self.MCP_CONFIG_FLAG}")
         
-        log_router_activity(f"CLIFlagManager: Final generated CLI flags: {flags}")
+        log_router_activity("CLIFlagManager: Final generated CLI flags: %s", flags)
         return flags
 
 
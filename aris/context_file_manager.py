@@ -1,13 +1,114 @@
+import io
 import os
 import re
 import uuid
 import time
-import hashlib
+import mmap
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
 from .logging_utils import log_router_activity, log_error, log_warning, log_debug
 
+# Consolidated reference files are written in binary mode through a large buffer;
+# source files up to this size are prefetched whole
+_COPY_BUFFER_SIZE = 1 << 20
+_REFERENCE_FILE_HEADER = (
+    b"# ARIS Context Reference\n\n"
+    b"This file contains reference materials assembled for this session.\n\n"
+)
+_SECTION_SEPARATOR = b"\n\n---\n\n"
+# Upper bound on threads used to read source files for one reference file
+_MAX_READ_WORKERS = 8
+
+# Embedded context files larger than this are read through a sequential-access mmap
+_MMAP_READ_THRESHOLD = 1 << 20
+
+# Characters stripped from session IDs in file names, and replaced in XML tag names
+_UNSAFE_SESSION_ID_CHARS_RE = re.compile(r'[^a-zA-Z0-9_-]')
+_UNSAFE_TAG_CHARS_RE = re.compile(r'[^a-zA-Z0-9_]')
+
+# Number of assembled embedded-context strings kept by prepare_embedded_context
+_EMBEDDED_CACHE_SIZE = 8
+
+def _read_context_text(file_path: str) -> str:
+    """
+    Read a context file as UTF-8 text with universal newlines.
+    
+    Large files are mapped and advised for sequential access so the kernel reads ahead
+    instead of copying through a read buffer.
+    
+    Args:
+        file_path: Path to the context file
+    
+    Returns:
+        The decoded file content
+    """
+    with open(file_path, 'rb') as source_file:
+        if os.fstat(source_file.fileno()).st_size <= _MMAP_READ_THRESHOLD:
+            return io.TextIOWrapper(source_file, encoding='utf-8').read()
+        with mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            content = str(mapped, 'utf-8')
+    if '\r' in content:
+        # Match the newline translation of a text-mode read
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+def _normalize_context_bytes(content: bytes) -> bytes:
+    """
+    Check that a context file's bytes are UTF-8 and translate newlines like a text-mode read.
+    
+    Args:
+        content: Raw file content
+    
+    Returns:
+        The content with CRLF and CR line endings replaced by LF
+    
+    Raises:
+        UnicodeDecodeError: If the content is not valid UTF-8
+    """
+    content.decode('utf-8')
+    if b'\r' in content:
+        # CR never occurs inside a multi-byte UTF-8 sequence, so this is safe on the bytes
+        content = content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    return content
+
+def _read_small_file(file_path: str) -> Tuple[Optional[bytes], Optional[Exception]]:
+    """
+    Read a context file's bytes unless it is large enough to be streamed instead.
+    
+    Args:
+        file_path: Path to the context file
+    
+    Returns:
+        Tuple of (content, error); content is None for large files or when reading failed
+    """
+    try:
+        with open(file_path, 'rb') as source_file:
+            if os.fstat(source_file.fileno()).st_size > _COPY_BUFFER_SIZE:
+                return None, None
+            return source_file.read(), None
+    except Exception as e:
+        return None, e
+
+def _prefetch_context_files(context_files: List[str]) -> List[Tuple[Optional[bytes], Optional[Exception]]]:
+    """
+    Read several context files on a small thread pool so their disk reads overlap.
+    
+    Args:
+        context_files: List of paths to context files
+    
+    Returns:
+        One (content, error) tuple per path, in the same order
+    """
+    if len(context_files) < 2:
+        return [_read_small_file(file_path) for file_path in context_files]
+    with ThreadPoolExecutor(max_workers=min(_MAX_READ_WORKERS, len(context_files))) as executor:
+        return list(executor.map(_read_small_file, context_files))
+
 class ContextFileManager:
     """Manages consolidated context files for optimized token usage."""
     
@@ -25,31 +126,28 @@ class ContextFileManager:
             self.base_temp_dir = os.path.join(tempfile.gettempdir(), "cc_so_context")
         
         os.makedirs(self.base_temp_dir, exist_ok=True)
-        self.temp_files = {}  # Maps context hash -> temp file path
+        self.temp_files = {}  # Maps tuple of context paths -> (temp file path, context signature)
+        self._embedded_cache: OrderedDict = OrderedDict()  # (paths, context signature) -> embedded content
         log_debug(f"ContextFileManager: Initialized with temp directory: {self.base_temp_dir}")
     
-    def _generate_context_hash(self, context_files: List[str]) -> str:
+    def _context_signature(self, context_files: List[str]) -> Tuple[Tuple[str, int, int], ...]:
         """
-        Generate a hash of the context files and their modification times.
+        Build a signature of the context files and their current state.
         
         Args:
             context_files: List of paths to context files
         
         Returns:
-            A hash string representing the files and their current state
+            A tuple of (path, mtime_ns, size) for each existing file; it changes whenever a file does
         """
-        # Combine filenames and mod times to detect changes
-        hash_input = []
+        signature = []
         for file_path in context_files:
-            if os.path.exists(file_path):
-                mod_time = os.path.getmtime(file_path)
-                file_size = os.path.getsize(file_path)
-                hash_input.append(f"{file_path}:{mod_time}:{file_size}")
-        
-        # Generate a hash for this combination
-        hasher = hashlib.md5()
-        hasher.update(";".join(hash_input).encode('utf-8'))
-        return hasher.hexdigest()
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                continue
+            signature.append((file_path, st.st_mtime_ns, st.st_size))
+        return tuple(signature)
     
     def generate_context_file(self, context_files: List[str], session_id: str) -> str:
         """
@@ -62,48 +160,63 @@ class ContextFileManager:
         Returns:
             Path to the generated context file
         """
-        # Generate a hash of the context files and their modification times
-        context_hash = self._generate_context_hash(context_files)
+        # Capture the context files and their modification times
+        files_key = tuple(context_files)
+        context_signature = self._context_signature(context_files)
         
-        # Check if we already have a temp file for this context combination
-        if context_hash in self.temp_files and os.path.exists(self.temp_files[context_hash]):
-            log_debug(f"ContextFileManager: Using cached context file: {self.temp_files[context_hash]}")
-            return self.temp_files[context_hash]
+        # Reuse the temp file for this context combination while none of its files have changed
+        cached = self.temp_files.get(files_key)
+        if cached and cached[1] == context_signature and os.path.exists(cached[0]):
+            log_debug(f"ContextFileManager: Using cached context file: {cached[0]}")
+            return cached[0]
         
         # Create a new temporary file
-        safe_session_id = re.sub(r'[^a-zA-Z0-9_-]', '', session_id)
+        if session_id.isascii() and session_id.replace('-', '').replace('_', '').isalnum():
+            safe_session_id = session_id  # Already safe (e.g. a UUID)
+        else:
+            safe_session_id = _UNSAFE_SESSION_ID_CHARS_RE.sub('', session_id)
         temp_file_path = os.path.join(
             self.base_temp_dir, 
-            f"context_{safe_session_id}_{context_hash[:8]}.md"
+            f"context_{safe_session_id}_{hash(context_signature) & 0xFFFFFFFF:08x}.md"
         )
         
-        with open(temp_file_path, 'w', encoding='utf-8') as temp_file:
-            temp_file.write("# ARIS Context Reference\n\n")
-            temp_file.write("This file contains reference materials assembled for this session.\n\n")
+        # Read the smaller source files concurrently; the consolidated file is still written in order
+        prefetched = _prefetch_context_files(context_files)
+        
+        with open(temp_file_path, 'wb', buffering=_COPY_BUFFER_SIZE) as temp_file:
+            temp_file.write(_REFERENCE_FILE_HEADER)
             
             # Process each context file
-            for file_path in context_files:
+            for file_path, (content, read_error) in zip(context_files, prefetched):
                 try:
+                    if read_error is not None:
+                        raise read_error
+                    
                     # Extract filename for section heading
                     file_name = os.path.basename(file_path)
                     file_name_without_ext = os.path.splitext(file_name)[0]
+                    heading = f"\n\n## {file_name_without_ext}\n\n".encode('utf-8')
                     
-                    # Read the original file
-                    with open(file_path, 'r', encoding='utf-8') as source_file:
-                        content = source_file.read()
+                    # Decode and translate newlines the same way the embedded path does, so a
+                    # non-UTF-8 file gets an error section rather than being copied verbatim
+                    if content is not None:
+                        content = _normalize_context_bytes(content)
+                    else:
+                        # Too large to prefetch; read it like the embedded path
+                        content = _read_context_text(file_path).encode('utf-8')
                     
-                    # Write to consolidated file with clear section heading
-                    temp_file.write(f"\n\n## {file_name_without_ext}\n\n")
+                    # Write the content into the consolidated file under a clear section heading
+                    temp_file.write(heading)
                     temp_file.write(content)
-                    temp_file.write("\n\n---\n\n")
+                    temp_file.write(_SECTION_SEPARATOR)
                     
                 except Exception as e:
-                    temp_file.write(f"\n\n## ERROR: Failed to include {file_path}\n\n")
-                    temp_file.write(f"Error: {str(e)}\n\n")
+                    temp_file.write(f"\n\n## ERROR: Failed to include {file_path}\n\n".encode('utf-8'))
+                    temp_file.write(f"Error: {str(e)}\n\n".encode('utf-8'))
                     log_error(f"ContextFileManager: Failed to include file {file_path}: {e}")
         
         # Register for cleanup
-        self.temp_files[context_hash] = temp_file_path
+        self.temp_files[files_key] = (temp_file_path, context_signature)
         self._register_for_cleanup(temp_file_path)
         
         log_router_activity(f"ContextFileManager: Generated context file at {temp_file_path}")
@@ -129,7 +242,15 @@ class ContextFileManager:
         Returns:
             Formatted content with XML tags for embedding in the system prompt
         """
-        context_content = ""
+        # Unchanged files produce the same content, so reuse the last few assembled results
+        cache_key = (tuple(context_files), self._context_signature(context_files))
+        cached_content = self._embedded_cache.get(cache_key)
+        if cached_content is not None:
+            self._embedded_cache.move_to_end(cache_key)
+            log_debug("ContextFileManager: Using cached embedded context")
+            return cached_content
+        
+        parts = []
         
         for file_path in context_files:
             try:
@@ -138,19 +259,22 @@ class ContextFileManager:
                 file_name_without_ext = os.path.splitext(file_name)[0]
                 
                 # Create a sanitized tag name (remove spaces, special chars)
-                tag_name = re.sub(r'[^a-zA-Z0-9_]', '_', file_name_without_ext)
+                tag_name = _UNSAFE_TAG_CHARS_RE.sub('_', file_name_without_ext)
                 
                 # Read the original file
-                with open(file_path, 'r', encoding='utf-8') as source_file:
-                    content = source_file.read()
+                content = _read_context_text(file_path)
                 
                 # Add the content with XML-style tags
-                context_content += f"\n\n<context_{tag_name}>\n{content}\n</context_{tag_name}>\n\n"
+                parts.append(f"\n\n<context_{tag_name}>\n{content}\n</context_{tag_name}>\n\n")
                 
             except Exception as e:
                 log_error(f"ContextFileManager: Failed to prepare embedded context for {file_path}: {e}")
-                context_content += f"\n\n<context_error>\nFailed to include {file_path}: {str(e)}\n</context_error>\n\n"
+                parts.append(f"\n\n<context_error>\nFailed to include {file_path}: {str(e)}\n</context_error>\n\n")
         
+        context_content = "".join(parts)
+        self._embedded_cache[cache_key] = context_content
+        if len(self._embedded_cache) > _EMBEDDED_CACHE_SIZE:
+            self._embedded_cache.popitem(last=False)
         return context_content
     
     def estimate_context_size(self, context_files: List[str]) -> int:
@@ -165,9 +289,11 @@ class ContextFileManager:
         """
         total_size = 0
         for file_path in context_files:
+            # A single stat per file; missing files are simply skipped
             try:
-                if os.path.exists(file_path):
-                    total_size += os.path.getsize(file_path)
+                total_size += os.stat(file_path).st_size
+            except OSError:
+                continue
             except Exception as e:
                 log_warning(f"ContextFileManager: Failed to get size of {file_path}: {e}")
         
@@ -181,19 +307,22 @@ class ContextFileManager:
             max_age_hours: Maximum age in hours before a file is deleted
         """
         current_time = time.time()
-        for root, _, files in os.walk(self.base_temp_dir):
-            for file in files:
-                if file.startswith("context_"):
-                    file_path = os.path.join(root, file)
-                    file_age = current_time - os.path.getctime(file_path)
-                    if file_age > max_age_hours * 3600:
+        max_age_seconds = max_age_hours * 3600
+        # Context files are written flat into base_temp_dir; scandir entries carry their own stat
+        path_to_key = {cached[0]: cache_key for cache_key, cached in self.temp_files.items()}
+        with os.scandir(self.base_temp_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith("context_") and entry.is_file():
+                    file_path = entry.path
+                    file_age = current_time - entry.stat().st_ctime
+                    if file_age > max_age_seconds:
                         try:
                             os.remove(file_path)
                             log_debug(f"ContextFileManager: Removed old context file: {file_path}")
                             # Remove from cache if present
-                            for hash_key, path in list(self.temp_files.items()):
-                                if path == file_path:
-                                    del self.temp_files[hash_key]
+                            cache_key = path_to_key.pop(file_path, None)
+                            if cache_key is not None:
+                                del self.temp_files[cache_key]
                         except Exception as e:
                             log_warning(f"ContextFileManager: Failed to remove old file {file_path}: {e}")
 
@@ -5,13 +5,13 @@ import sys
 import json
 import asyncio
 import itertools
-from typing import Tuple, Optional, List, Dict, Any, Union
+from typing import TYPE_CHECKING, Tuple, Optional, List, Dict, Any, Union
 
-from prompt_toolkit import PromptSession, print_formatted_text
+from prompt_toolkit import print_formatted_text
 from prompt_toolkit.formatted_text import FormattedText
-from prompt_toolkit.patch_stdout import patch_stdout
-from prompt_toolkit.history import FileHistory
-from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
+
+if TYPE_CHECKING:
+    from prompt_toolkit import PromptSession
 
 from .logging_utils import (
     log_router_activity, 
@@ -26,14 +26,23 @@ from .profile_handler import process_special_commands
 from .interrupt_handler import get_interrupt_handler, InterruptContext
 from .progress_tracker import create_progress_tracker, ExecutionPhase
 
+# Prefer orjson for per-chunk stream parsing when installed; its JSONDecodeError
+# subclasses json.JSONDecodeError so error handling is unchanged
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Constants for spinner animation
 SPINNER_CHARS = ['|', '/', '-', '\\']
 SPINNER_DELAY = 0.15
+NON_TTY_SPINNER_DELAY = 0.2
 
-# Define a simple style for prompt_toolkit outputs
-try:
-    from .cli import cli_style
-except ImportError:
+# Define a simple style for prompt_toolkit outputs. Reuse the CLI's style when aris.cli is
+# already loaded (or loading) rather than importing it, which only fails on a circular import
+cli_style = getattr(sys.modules.get(f"{__package__}.cli"), 'cli_style', None)
+if cli_style is None:
     from prompt_toolkit.styles import Style
     cli_style = Style.from_dict({
         'prompt.user': 'bold fg:green',
@@ -54,35 +63,48 @@ class TurnCancelledError(Exception):
     """Exception raised when a turn is cancelled."""
     pass
 
-async def spinner_task(stop_event: asyncio.Event, thinking_message_prefix: str):
+async def spinner_task(stop_event: asyncio.Event, thinking_message_prefix: str, initial_delay: float = 0.0):
     """
     Displays a spinner animation while waiting for a response.
     
     Args:
         stop_event: Event to signal when to stop the spinner
         thinking_message_prefix: Prefix to show before the spinner character
+        initial_delay: Seconds to wait before drawing the first frame
     """
-    for char in itertools.cycle(SPINNER_CHARS):
+    if initial_delay:
+        # Stopped before the first frame: nothing was drawn, so there is nothing to clear
+        try:
+            await asyncio.wait_for(stop_event.wait(), initial_delay)
+            return
+        except asyncio.TimeoutError:
+            pass
+    # Build every frame once; each tick is then a single write of a ready string
+    frames = [f"\r{thinking_message_prefix}{char} " for char in SPINNER_CHARS]
+    # Nobody watches the animation when output is piped, so redraw less often
+    delay = SPINNER_DELAY if sys.stdout.isatty() else NON_TTY_SPINNER_DELAY
+    for frame in itertools.cycle(frames):
         if stop_event.is_set(): 
             break
-        sys.stdout.write(f"\r{thinking_message_prefix}{char} ")
+        sys.stdout.write(frame)
         sys.stdout.flush()
-        await asyncio.sleep(SPINNER_DELAY)
+        await asyncio.sleep(delay)
     sys.stdout.write('\r' + ' ' * (len(thinking_message_prefix) + 2) + '\r')
     sys.stdout.flush()
 
-def start_spinner(prefix: str):
+def start_spinner(prefix: str, initial_delay: float = 0.0):
     """
     Start a spinner animation.
     
     Args:
         prefix: Prefix to show before the spinner character
+        initial_delay: Seconds to wait before drawing the first frame
         
     Returns:
         Tuple of (event, task) for the spinner
     """
     ev = asyncio.Event()
-    task = asyncio.create_task(spinner_task(ev, prefix))
+    task = asyncio.create_task(spinner_task(ev, prefix, initial_delay))
     return ev, task
 
 async def stop_spinner(ev: asyncio.Event, task: asyncio.Task):
@@ -176,7 +198,9 @@ async def handle_route_chunks(
                 progress_tracker=progress_tracker
             ):
                 try:
-                    event_data = json.loads(chunk_str)
+                    event_data = _json_loads(chunk_str)
+                    # Read the routing keys once per event
+                    event_type = event_data.get("type")
                     session_id_from_event = event_data.get("session_id")
                     if session_id_from_event:
                         # Always store the latest session ID from events for return value
@@ -192,7 +216,7 @@ async def handle_route_chunks(
                     text_to_display = None
                     
                     # Handle system init message for MCP server status feedback
-                    if event_data.get("type") == "system" and event_data.get("subtype") == "init":
+                    if event_type == "system" and event_data.get("subtype") == "init":
                         mcp_servers = event_data.get("mcp_servers", [])
                         if mcp_servers:
                             failed_servers = [s for s in mcp_servers if s.get("status") == "failed"]
@@ -219,10 +243,11 @@ async def handle_route_chunks(
                                         ("fg:yellow", "Check server installation and configuration. Some tools may not be available.")
                                     ]), style=cli_style)
                                 
-                                stop_spinner_event, spinner = start_spinner(thinking_prefix)
+                                stop_spinner_event, spinner = start_spinner(thinking_prefix, initial_delay=SPINNER_DELAY)
                     
-                    elif event_data.get("type") == "assistant":
-                        message_content = event_data.get("message", {}).get("content", [])
+                    elif event_type == "assistant":
+                        message = event_data.get("message")
+                        message_content = message.get("content", ()) if message else ()
                         for content_item in message_content:
                             if content_item.get("type") == "text":
                                 text_piece = content_item.get("text", "")
@@ -230,7 +255,7 @@ async def handle_route_chunks(
                                     text_to_display = text_piece
                                     assistant_text_parts.append(text_piece)
                                     assistant_spoke = True 
-                    elif event_data.get("type") == "result" and event_data.get("subtype") == "success" and not assistant_spoke:
+                    elif event_type == "result" and event_data.get("subtype") == "success" and not assistant_spoke:
                         result_text = event_data.get("result")
                         if isinstance(result_text, str):
                             text_to_display = result_text
@@ -240,26 +265,31 @@ async def handle_route_chunks(
                     if text_to_display is not None:
                         await stop_spinner(stop_spinner_event, spinner) 
                         current_prefix = thinking_prefix.split("<")[0] + "< "
+                        # Strip once; the same text is printed and, with TTS on, summarized
+                        display_text = text_to_display.strip()
                         print_formatted_text(FormattedText([
                             ("class:prompt.assistant.prefix", current_prefix),
-                            ("class:prompt.assistant.text", text_to_display.strip())
+                            ("class:prompt.assistant.text", display_text)
                         ]), style=cli_style)
                         
                         if TEXT_MODE_TTS_ENABLED:
-                            log_debug(f"[TTS] Individual Piece Triggered for text mode. Text: '{text_to_display[:30]}...'")
-                            summary = await summarize_for_voice(text_to_display) 
+                            log_debug(f"[TTS] Individual Piece Triggered for text mode. Text: '{display_text[:30]}...'")
+                            summary = await summarize_for_voice(display_text) 
                             asyncio.create_task(tts_speak(summary))
                         
-                        stop_spinner_event, spinner = start_spinner(thinking_prefix)
+                        # Hold off redrawing so back-to-back messages don't flash the spinner between them
+                        stop_spinner_event, spinner = start_spinner(thinking_prefix, initial_delay=SPINNER_DELAY)
 
                     # Check if this is a reference file read confirmation message
+                    # (cheap flag checks first; the text is only scanned until the read is confirmed)
                     if (is_first_message and reference_file_path and
                         text_to_display is not None and
-                        "read" in text_to_display.lower() and 
-                        "reference file" in text_to_display.lower()):
-                        if not isinstance(session_state, str):
-                            session_state.has_read_reference_file = True
-                            log_debug(f"Detected reference file read confirmation: {text_to_display[:50]}...")
+                        not getattr(session_state, "has_read_reference_file", False)):
+                        lowered_text = text_to_display.lower()
+                        if "read" in lowered_text and "reference file" in lowered_text:
+                            if not isinstance(session_state, str):
+                                session_state.has_read_reference_file = True
+                                log_debug(f"Detected reference file read confirmation: {text_to_display[:50]}...")
 
                 except json.JSONDecodeError: 
                     log_warning(f"Non-JSON chunk from Claude CLI: {chunk_str.strip()}")
@@ -337,7 +367,7 @@ async def handle_route_chunks(
     else:
         return session_state.session_id, concatenated_text, assistant_spoke
 
-async def text_mode_one_turn(prompt_session: PromptSession, session_state: SessionState) -> Tuple[str, SessionState]:
+async def text_mode_one_turn(prompt_session: "PromptSession", session_state: SessionState) -> Tuple[str, SessionState]:
     """
     Process one turn in text mode.
     
@@ -349,6 +379,8 @@ async def text_mode_one_turn(prompt_session: PromptSession, session_state: Sessi
         Tuple of (action, updated_session_state)
     """
     from .cli_args import TEXT_MODE_TTS_ENABLED
+    # Only the interactive prompt needs stdout patching, so load it on first use
+    from prompt_toolkit.patch_stdout import patch_stdout
     
     user_msg_input = ""
     try:
@@ -395,12 +427,8 @@ async def text_mode_one_turn(prompt_session: PromptSession, session_state: Sessi
     if user_msg_input.lower() in {"exit", "quit"}: 
         return 'exit', session_state
     if user_msg_input.lower() == "new": 
-        # For test compatibility with expected None
-        if isinstance(session_state, str):
-            return 'new_conversation', None
-        else:
-            session_state = SessionState()  # Create a new session
-            return 'new_conversation', session_state
+        session_state = SessionState()  # Create a new session
+        return 'new_conversation', session_state
     if not user_msg_input: 
         return 'continue', session_state
 
@@ -408,7 +436,7 @@ async def text_mode_one_turn(prompt_session: PromptSession, session_state: Sessi
     
     # Process the message through the assistant
     profile_name = "default"
-    if not isinstance(session_state, str) and hasattr(session_state, 'active_profile') and session_state.active_profile:
+    if hasattr(session_state, 'active_profile') and session_state.active_profile:
         profile_name = session_state.active_profile.get("profile_name", "default")
     
     try:
@@ -418,12 +446,8 @@ async def text_mode_one_turn(prompt_session: PromptSession, session_state: Sessi
             f"🤖 ARIS [{profile_name}] < Thinking... "
         )
         
-        # For test compatibility
-        if isinstance(session_state, str):
-            return 'continue', new_session_id
-            
         # Update session ID if we got a new one from the event
-        if new_session_id and not isinstance(session_state, str) and session_state is not None:
+        if new_session_id and session_state is not None:
             if new_session_id != session_state.session_id:
                 session_state.session_id = new_session_id
         
@@ -70,8 +70,8 @@ class InterruptHandler:
         """Restore original signal handler and clean up."""
         log_router_activity("InterruptHandler: Shutting down")
         
-        # Cancel any active tasks
-        for task in self._active_tasks:
+        # Cancel any active tasks (snapshot: cancellation callbacks may shrink the set)
+        for task in list(self._active_tasks):
             if not task.done():
                 task.cancel()
         
@@ -94,7 +94,9 @@ class InterruptHandler:
         self.current_context = context
         log_debug(f"InterruptHandler: Context changed from {old_context.value} to {context.value}")
         
-        # Re-ensure our signal handler is active when changing context
+        # Re-ensure our signal handler is active on every change: prompt_toolkit restores
+        # the default SIGINT handler when a prompt returns, so a skipped check leaves
+        # Ctrl+C raising KeyboardInterrupt. getsignal is cheap enough to always call.
         current_handler = signal.getsignal(signal.SIGINT)
         if current_handler != self._handle_interrupt:
             log_debug(f"InterruptHandler: Re-installing signal handler (was {current_handler})")
@@ -122,13 +124,11 @@ class InterruptHandler:
     
     def track_task(self, task: asyncio.Task):
         """Track an active task that should be cancelled on exit."""
+        # A strong reference also keeps fire-and-forget tasks alive until they finish
         self._active_tasks.add(task)
         
         # Remove task when it's done
-        def remove_task(t):
-            self._active_tasks.discard(t)
-        
-        task.add_done_callback(remove_task)
+        task.add_done_callback(self._active_tasks.discard)
     
     def _handle_interrupt_async(self):
         """Async wrapper for interrupt handling."""
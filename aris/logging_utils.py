@@ -2,6 +2,8 @@ import json
 from datetime import datetime
 import os # Added for path normalization if needed in future
 import sys # Import sys for stderr printing
+import atexit
+import threading
 
 # print("[DEBUG_TRACE_IMPORT] TOP OF logging_utils.py", file=sys.stderr) # Removed
 
@@ -13,21 +15,62 @@ CYAN = '\033[96m'
 RESET = '\033[0m'
 DIM = '\033[2m'
 
+# Numeric severities, matching the stdlib logging values
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+CRITICAL = 50
+
 LOG_LEVELS = {
-    "DEBUG": {"color": DIM, "prefix": "DEBUG"},
-    "INFO": {"color": RESET, "prefix": "INFO"},
-    "ROUTER_ACTIVITY": {"color": CYAN, "prefix": "ROUTER_ACTIVITY"},
-    "TOOL_CALL": {"color": GREEN, "prefix": "TOOL_CALL"},
-    "WARNING": {"color": YELLOW, "prefix": "WARNING"},
-    "ERROR": {"color": RED, "prefix": "ERROR"},
-    "USER_COMMAND_RAW_TEXT": {"color": RESET, "prefix": "USER_COMMAND_RAW_TEXT"}, # Console color is RESET (none)
-    "USER_COMMAND_RAW_VOICE": {"color": RESET, "prefix": "USER_COMMAND_RAW_VOICE"}, # New level for voice input
-    "LOGGING_ERROR": {"color": RED, "prefix": "LOGGING_ERROR"},
+    "DEBUG": {"color": DIM, "prefix": "DEBUG", "rank": DEBUG},
+    "INFO": {"color": RESET, "prefix": "INFO", "rank": INFO},
+    "ROUTER_ACTIVITY": {"color": CYAN, "prefix": "ROUTER_ACTIVITY", "rank": INFO},
+    "TOOL_CALL": {"color": GREEN, "prefix": "TOOL_CALL", "rank": INFO},
+    "WARNING": {"color": YELLOW, "prefix": "WARNING", "rank": WARNING},
+    "ERROR": {"color": RED, "prefix": "ERROR", "rank": ERROR},
+    "USER_COMMAND_RAW_TEXT": {"color": RESET, "prefix": "USER_COMMAND_RAW_TEXT", "rank": INFO}, # Console color is RESET (none)
+    "USER_COMMAND_RAW_VOICE": {"color": RESET, "prefix": "USER_COMMAND_RAW_VOICE", "rank": INFO}, # New level for voice input
+    "LOGGING_ERROR": {"color": RED, "prefix": "LOGGING_ERROR", "rank": CRITICAL},
 }
 
+# " [PREFIX] " tag written between the timestamp and the message, built once per level
+_LEVEL_TAGS = {level_key: f" [{config['prefix']}] " for level_key, config in LOG_LEVELS.items()}
+
 # --- Logging Configuration --- #
 _CONSOLE_LOGGING_ENABLED = False
 _LOG_FILE_PATH = "aris_run.log" # Default log file name
+_MIN_LEVEL = DEBUG # Records ranked below this are dropped before any formatting
+
+# Log file descriptor kept open across calls; reopened whenever _LOG_FILE_PATH changes
+_LOG_FD = None
+_LOG_FD_PATH = None
+# Reentrant: the SIGINT handler logs from the main thread, possibly while it is mid-write
+_LOG_WRITE_LOCK = threading.RLock()
+
+def _open_log_file() -> int:
+    """Opens _LOG_FILE_PATH for appending as the shared log file descriptor.
+    
+    With O_APPEND each record is a single atomic os.write to the end of the file.
+    """
+    global _LOG_FD, _LOG_FD_PATH
+    _close_log_file()
+    _LOG_FD = os.open(_LOG_FILE_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    _LOG_FD_PATH = _LOG_FILE_PATH
+    return _LOG_FD
+
+def _close_log_file():
+    """Closes the shared log file descriptor, if one is open."""
+    global _LOG_FD, _LOG_FD_PATH
+    if _LOG_FD is not None:
+        try:
+            os.close(_LOG_FD)
+        except OSError:
+            pass
+    _LOG_FD = None
+    _LOG_FD_PATH = None
+
+atexit.register(_close_log_file)
 
 def create_timestamped_log_path(base_log_file: str = "aris_run.log", workspace_path: str = None) -> str:
     """
@@ -70,10 +113,14 @@ def create_timestamped_log_path(base_log_file: str = "aris_run.log", workspace_p
     log_file_path = os.path.join(logs_dir, timestamped_filename)
     return os.path.abspath(log_file_path)
 
-def configure_logging(enable_console_logging: bool, log_file_path: str = "aris_run.log", workspace_path: str = None):
-    """Configures logging behavior (console and file) with timestamped log files."""
-    global _CONSOLE_LOGGING_ENABLED, _LOG_FILE_PATH
+def configure_logging(enable_console_logging: bool, log_file_path: str = "aris_run.log", workspace_path: str = None, min_level: int = DEBUG):
+    """Configures logging behavior (console and file) with timestamped log files.
+    
+    Records ranked below ``min_level`` (DEBUG, INFO, WARNING, ERROR) are skipped entirely.
+    """
+    global _CONSOLE_LOGGING_ENABLED, _LOG_FILE_PATH, _MIN_LEVEL
     _CONSOLE_LOGGING_ENABLED = enable_console_logging
+    _MIN_LEVEL = min_level
     
     # Create timestamped log path
     _LOG_FILE_PATH = create_timestamped_log_path(log_file_path, workspace_path)
@@ -82,6 +129,8 @@ def configure_logging(enable_console_logging: bool, log_file_path: str = "aris_r
     console_status = "enabled" if _CONSOLE_LOGGING_ENABLED else "disabled"
     
     try:
+        with _LOG_WRITE_LOCK:
+            _close_log_file()  # Later records reopen against the new path
         with open(_LOG_FILE_PATH, "w", encoding="utf-8") as f:  # Use 'w' to create new file
             f.write(f"{timestamp} [INFO] Logging configured by configure_logging. Console: {console_status}. Target Log File: {_LOG_FILE_PATH}\n")
             if workspace_path:
@@ -89,24 +138,36 @@ def configure_logging(enable_console_logging: bool, log_file_path: str = "aris_r
     except Exception as e:
         print(f"{RED}{timestamp} [LOGGING_ERROR] INITIALIZATION: Failed to write to log file {_LOG_FILE_PATH}: {e}{RESET}", file=sys.stderr)
 
-def _log_message(level_key: str, message: str, exception_info: str | None = None):
-    """Internal generic logging function. Logs to file always, and to console if enabled."""
+def _log_message(level_key: str, message: str, exception_info: str | None = None, args: tuple = ()):
+    """Internal generic logging function. Logs to file always, and to console if enabled.
+    
+    When ``args`` are given, ``message`` is treated as a %-format string and is only
+    interpolated here, so callers can defer formatting with log_debug("x=%s", x).
+    """
+    if args:
+        try:
+            message = message % args
+        except (TypeError, ValueError):
+            # A mismatched format string must not lose the record (or raise into the caller)
+            message = f"{message} {args!r}"
     timestamp = datetime.now().isoformat()
-    log_level_config = LOG_LEVELS.get(level_key, {"color": RESET, "prefix": level_key})
     
-    # --- Absolute crucial debug print to stderr --- #
-    # print(f"[DEBUG_LOGGING_UTIL] _log_message trying to write to: {_LOG_FILE_PATH} (Level: {level_key})", file=sys.stderr) # Removed
-
     # 1. Prepare and write to log file (always, plain text)
-    file_log_prefix = f"{timestamp} [{log_level_config['prefix']}]"
-    file_log_message = f"{file_log_prefix} {message}"
+    level_tag = _LEVEL_TAGS.get(level_key) or f" [{level_key}] "
     if exception_info:
-        file_log_message += f"\n    Details: {exception_info}"
+        file_log_message = f"{timestamp}{level_tag}{message}\n    Details: {exception_info}\n"
+    else:
+        file_log_message = f"{timestamp}{level_tag}{message}\n"
 
+    payload = file_log_message.encode("utf-8")
     try:
-        with open(_LOG_FILE_PATH, "a", encoding="utf-8") as f:
-            f.write(file_log_message + "\n")
+        with _LOG_WRITE_LOCK:
+            fd = _LOG_FD
+            if fd is None or _LOG_FD_PATH != _LOG_FILE_PATH:
+                fd = _open_log_file()
+            os.write(fd, payload)
     except Exception as e:
+        log_level_config = LOG_LEVELS.get(level_key, {"color": RESET, "prefix": level_key})
         # Fallback: If file logging fails, print a critical error to console regardless of verbosity.
         # These LOGGING_ERROR messages also go to stderr for max visibility
         print(f"{RED}{timestamp} [{LOG_LEVELS['LOGGING_ERROR']['prefix']}] Failed to write to log file {_LOG_FILE_PATH}: {e}{RESET}", file=sys.stderr)
@@ -116,6 +177,7 @@ def _log_message(level_key: str, message: str, exception_info: str | None = None
 
     # 2. Conditional console printing
     if _CONSOLE_LOGGING_ENABLED:
+        log_level_config = LOG_LEVELS.get(level_key, {"color": RESET, "prefix": level_key})
         console_prefix_for_print = f"{timestamp} [{log_level_config['prefix']}]"
         
         if level_key == "USER_COMMAND_RAW_TEXT":
@@ -128,10 +190,14 @@ def _log_message(level_key: str, message: str, exception_info: str | None = None
             if exception_info:
                 print(f"{log_level_config['color']}{DIM}    Details: {exception_info}{RESET}")
 
-def log_router_activity(message: str):
-    _log_message("ROUTER_ACTIVITY", message)
+def log_router_activity(message: str, *args):
+    if INFO < _MIN_LEVEL:
+        return
+    _log_message("ROUTER_ACTIVITY", message, args=args)
 
 def log_tool_call(tool_name: str, tool_args: dict, tool_result: dict | str | None = None):
+    if INFO < _MIN_LEVEL:
+        return  # Skip the JSON serialization too
     args_str = json.dumps(tool_args)
     result_str = ""
     if tool_result is not None:
@@ -142,24 +208,36 @@ def log_tool_call(tool_name: str, tool_args: dict, tool_result: dict | str | Non
     _log_message("TOOL_CALL", f"Tool: {tool_name}, Args: {args_str}{result_str}")
 
 def log_error(message: str, exception_info: str | None = None):
+    if ERROR < _MIN_LEVEL:
+        return
     _log_message("ERROR", message, exception_info)
 
-def log_warning(message: str):
-    _log_message("WARNING", message)
+def log_warning(message: str, *args):
+    if WARNING < _MIN_LEVEL:
+        return
+    _log_message("WARNING", message, args=args)
 
-def log_debug(message: str): # Added for general debug purposes
-    _log_message("DEBUG", message)
+def log_debug(message: str, *args): # Added for general debug purposes
+    if DEBUG < _MIN_LEVEL:
+        return
+    _log_message("DEBUG", message, args=args)
 
 # Added a simple log_info for testing purposes in __main__
-def log_info(message: str):
-    _log_message("INFO", message) 
+def log_info(message: str, *args):
+    if INFO < _MIN_LEVEL:
+        return
+    _log_message("INFO", message, args=args)
 
 def log_user_command_raw_text(message: str):
     """Logs the raw user command text without additional color formatting for easier parsing."""
+    if INFO < _MIN_LEVEL:
+        return
     _log_message("USER_COMMAND_RAW_TEXT", message)
 
 def log_user_command_raw_voice(message: str):
     """Logs the raw user voice command text without additional color formatting for easier parsing."""
+    if INFO < _MIN_LEVEL:
+        return
     _log_message("USER_COMMAND_RAW_VOICE", message)
 
 def get_current_log_file_path() -> str:
@@ -390,13 +390,14 @@ def create_profile_interactive(profile_name: str):
             ("class:error", f"\nFailed to create profile '{profile_name}'")
         ]), style=cli_style)
 
-def activate_profile(profile_name: str, session_state: SessionState) -> bool:
+def activate_profile(profile_name: str, session_state: SessionState, resolved_profile: Optional[Dict] = None) -> bool:
     """
     Activate a profile.
     
     Args:
         profile_name: The name of the profile to activate
         session_state: The current session state
+        resolved_profile: The profile already resolved by the caller, if any; skips a second lookup
         
     Returns:
         True if the profile was activated successfully, False otherwise
@@ -408,7 +409,9 @@ def activate_profile(profile_name: str, session_state: SessionState) -> bool:
             from .workspace_manager import workspace_manager
             workspace_variables = workspace_manager.get_workspace_variables(session_state.workspace_path)
         
-        profile = profile_manager.get_profile(profile_name, resolve=True, workspace_variables=workspace_variables)
+        profile = resolved_profile
+        if profile is None:
+            profile = profile_manager.get_profile(profile_name, resolve=True, workspace_variables=workspace_variables)
         if profile:
             # Get template variables
             variables = collect_template_variables(profile)
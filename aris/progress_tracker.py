@@ -454,6 +454,20 @@ class ProgressTracker:
     def has_insights(self) -> bool:
         """Check if this tracker has insights capabilities enabled"""
         return self.insights_collector is not None
+    
+    def has_metrics(self) -> bool:
+        """Check if any session activity has been recorded (cheap gate before get_completion_summary)"""
+        if not self.insights_collector:
+            return False
+        
+        metrics = self.insights_collector.metrics
+        return bool(
+            metrics.current_cost_usd
+            or metrics.api_calls_made
+            or metrics.tools_executed
+            or metrics.workspace_files_created
+            or metrics.workspace_files_modified
+        )
 
 
 
@@ -187,12 +187,8 @@ class VoiceHandler:
         if user_text.strip().lower() in {"exit", "quit"}:
             return 'exit', session_state
         if user_text.strip().lower() == "new":
-            # For test compatibility with expected None
-            if isinstance(session_state, str):
-                return 'new_conversation', None
-            else:
-                session_state = SessionState()  # Create a new session
-                return 'new_conversation', session_state
+            session_state = SessionState()  # Create a new session
+            return 'new_conversation', session_state
     
         lowered_text = user_text.lower()
         if self.trigger_words and not any(tw in lowered_text for tw in self.trigger_words):
@@ -212,7 +208,7 @@ class VoiceHandler:
         from .interaction_handler import handle_route_chunks
         
         profile_name = "default"
-        if not isinstance(session_state, str) and hasattr(session_state, 'active_profile') and session_state.active_profile:
+        if hasattr(session_state, 'active_profile') and session_state.active_profile:
             profile_name = session_state.active_profile.get("profile_name", "default")
             
         new_session_id, assistant_full_text, spoke = await handle_route_chunks(
@@ -226,12 +222,8 @@ class VoiceHandler:
             summary = await summarize_for_voice(assistant_full_text)
             asyncio.create_task(tts_speak(summary))
         
-        # For test compatibility
-        if isinstance(session_state, str):
-            return 'continue', new_session_id
-            
         # Update session ID if we got a new one from the event
-        if new_session_id and not isinstance(session_state, str) and session_state is not None:
+        if new_session_id and session_state is not None:
             if new_session_id != session_state.session_id:
                 session_state.session_id = new_session_id
     
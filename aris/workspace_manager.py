@@ -14,6 +14,8 @@ class WorkspaceManager:
     def __init__(self):
         self.original_cwd: Optional[str] = None
         self.current_workspace: Optional[str] = None
+        # True only while we have chdir'd away from original_cwd
+        self._switched = False
     
     def resolve_workspace_path(self, workspace_arg: Optional[str]) -> str:
         """
@@ -67,6 +69,7 @@ class WorkspaceManager:
             # Store workspace state
             self.original_cwd = original_cwd
             self.current_workspace = workspace_path
+            self._switched = True
             
             return original_cwd
         except OSError as e:
@@ -79,12 +82,18 @@ class WorkspaceManager:
     def restore_original_directory(self):
         """
         Restore the original working directory.
+        
+        Does nothing unless setup_workspace changed directory since the last restore.
         """
+        if not self._switched:
+            return
+        
         if self.original_cwd and os.path.exists(self.original_cwd):
             try:
                 os.chdir(self.original_cwd)
                 log_debug(f"WorkspaceManager: Restored original directory: {self.original_cwd}")
                 self.current_workspace = None
+                self._switched = False
             except Exception as e:
                 log_warning(f"WorkspaceManager: Failed to restore original directory '{self.original_cwd}': {e}")
         else:
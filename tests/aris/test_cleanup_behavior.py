@@ -109,8 +109,8 @@ class TestMCPServerCleanup:
         
         with patch('aris.cli._workflow_mcp_server_started', True), \
              patch('aris.cli._profile_mcp_server_started', True), \
-             patch('aris.cli._workflow_mcp_server_thread', Mock()), \
-             patch('aris.cli._profile_mcp_server_thread', Mock()), \
+             patch('aris.cli._workflow_uv_server', Mock()), \
+             patch('aris.cli._profile_uv_server', Mock()), \
              patch('aris.cli.log_debug') as mock_log:
             
             # Test shutdown function
@@ -123,48 +123,114 @@ class TestMCPServerCleanup:
     
     @pytest.mark.asyncio
     async def test_mcp_server_startup_tracking(self):
-        """Test that MCP server threads are properly tracked for cleanup."""
+        """Test that the profile MCP server runs as a tracked task on the event loop."""
         
         mock_server = Mock()
-        mock_server.run_server_blocking = Mock()
-        
-        with patch('aris.profile_mcp_server.ProfileMCPServer', return_value=mock_server), \
-             patch('aris.cli.threading.Thread') as mock_thread_class, \
+        mock_server.start_server_async = AsyncMock()
+        mock_server.host = "127.0.0.1"
+        mock_server.port = 8094
+        mock_uv_server = Mock()
+        mock_task = Mock()
+        
+        with patch('aris.cli.ProfileMCPServer', return_value=mock_server), \
+             patch('aris.cli._start_uvicorn_task', new_callable=AsyncMock,
+                   return_value=(mock_uv_server, mock_task)) as mock_start, \
+             patch('aris.cli._profile_mcp_server_started', False), \
+             patch('aris.cli._profile_uv_server', None), \
+             patch('aris.cli._profile_mcp_task', None), \
              patch('aris.cli.PARSED_ARGS') as mock_args:
             
             mock_args.profile_mcp_port = 8094
-            mock_thread = Mock()
-            mock_thread_class.return_value = mock_thread
+            mock_args.verbose = False
             
-            # Mock the ready event 
-            with patch('aris.cli.threading.Event') as mock_event_class:
-                mock_event = Mock()
-                mock_event.wait.return_value = True
-                mock_event_class.return_value = mock_event
-                
-                # Test server startup
-                await _start_profile_mcp_server()
-                
-                # Verify thread was created and started
-                mock_thread_class.assert_called_once()
-                mock_thread.start.assert_called_once()
-                
-                # Verify daemon=True was set
-                call_kwargs = mock_thread_class.call_args[1]
-                assert call_kwargs['daemon'] is True
+            await _start_profile_mcp_server()
+            
+            # Tools are registered before uvicorn starts serving
+            mock_server.start_server_async.assert_awaited_once()
+            mock_start.assert_awaited_once()
+            assert mock_start.call_args[0][0] is mock_server.starlette_app
+            
+            # The server and its task are tracked for shutdown
+            import aris.cli
+            assert aris.cli._profile_uv_server is mock_uv_server
+            assert aris.cli._profile_mcp_task is mock_task
+            assert aris.cli._profile_mcp_server_started is True
+    
+    @pytest.mark.asyncio
+    async def test_uvicorn_task_starts_and_shuts_down(self):
+        """Test that an in-loop uvicorn server binds and exits cleanly when asked."""
+        from starlette.applications import Starlette
+        from aris.cli import _start_uvicorn_task
+        
+        uv_server, task = await _start_uvicorn_task(Starlette(), "127.0.0.1", 0, startup_timeout=5.0)
+        
+        assert uv_server.started
+        assert uv_server.ready.is_set()
+        assert not task.done()
+        
+        uv_server.should_exit = True
+        await asyncio.wait_for(task, timeout=5.0)
+        assert task.done() and task.exception() is None
+    
+    @pytest.mark.asyncio
+    async def test_shutdown_waits_for_server_task(self):
+        """Test that shutdown returns only after the uvicorn task has released its port."""
+        from starlette.applications import Starlette
+        from aris.cli import _start_uvicorn_task, _MCP_GRACEFUL_SHUTDOWN_TIMEOUT
+        
+        uv_server, task = await _start_uvicorn_task(Starlette(), "127.0.0.1", 0, startup_timeout=5.0)
+        assert uv_server.config.timeout_graceful_shutdown == _MCP_GRACEFUL_SHUTDOWN_TIMEOUT
+        
+        with patch('aris.cli._workflow_mcp_server_started', True), \
+             patch('aris.cli._workflow_uv_server', uv_server), \
+             patch('aris.cli._workflow_mcp_task', task):
+            await _shutdown_mcp_servers()
+        
+        assert task.done()
+        assert uv_server.should_exit is True
+    
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_unresponsive_server_task(self):
+        """Test that a server task ignoring should_exit is cancelled rather than leaked."""
+        
+        async def stuck_server():
+            await asyncio.sleep(30)
+        
+        task = asyncio.create_task(stuck_server())
+        
+        with patch('aris.cli._MCP_GRACEFUL_SHUTDOWN_TIMEOUT', -0.9), \
+             patch('aris.cli._profile_mcp_server_started', True), \
+             patch('aris.cli._profile_uv_server', Mock()), \
+             patch('aris.cli._profile_mcp_task', task), \
+             patch('aris.cli.log_warning') as mock_warning:
+            await _shutdown_mcp_servers()
+        
+        assert task.cancelled()
+        mock_warning.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_uvicorn_task_reports_port_in_use(self):
+        """Test that a bind failure is raised as an error instead of exiting the process."""
+        import socket
+        from starlette.applications import Starlette
+        from aris.cli import _start_uvicorn_task
+        
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as busy:
+            busy.bind(("127.0.0.1", 0))
+            busy.listen()
+            port = busy.getsockname()[1]
+            
+            with pytest.raises(RuntimeError):
+                await _start_uvicorn_task(Starlette(), "127.0.0.1", port, startup_timeout=5.0)
     
     def test_port_reuse_configuration(self):
         """Test that MCP servers are configured for proper port reuse."""
         
-        # Import the function definition
-        from aris.cli import _start_workflow_mcp_server
+        from aris.cli import _start_uvicorn_task
         
-        # Get the inner function that runs in the thread
         import inspect
-        source = inspect.getsource(_start_workflow_mcp_server)
+        source = inspect.getsource(_start_uvicorn_task)
         
-        # Verify environment variable setting is present
-        assert 'UVICORN_SERVER_SOCKET_REUSE' in source
         assert 'access_log=False' in source
 
 
@@ -182,12 +248,8 @@ class TestCleanupIntegration:
         mock_workspace_manager = Mock()
         
         with patch('aris.cli._shutdown_mcp_servers', new_callable=AsyncMock) as mock_shutdown_mcp, \
-             patch('aris.cli._signal_handler_task', Mock()) as mock_signal_task, \
              patch('aris.cli.log_debug') as mock_log:
             
-            mock_signal_task.done.return_value = False
-            mock_signal_task.cancel = Mock()
-            
             # Import the cleanup section logic (we'd need to extract it to a function)
             # For now, test the MCP shutdown part
             await mock_shutdown_mcp()
@@ -195,6 +257,14 @@ class TestCleanupIntegration:
             # Verify MCP shutdown was called
             mock_shutdown_mcp.assert_called_once()
     
+    def test_cli_shares_global_interrupt_handler(self):
+        """Test that the CLI and the mode handlers use one interrupt handler instance."""
+        from aris import cli
+        from aris.interrupt_handler import get_interrupt_handler
+        
+        # Two instances would each re-install their own SIGINT handler over the other
+        assert cli.interrupt_handler is get_interrupt_handler()
+    
     @pytest.mark.asyncio
     async def test_interrupt_handling_during_cleanup(self):
         """Test that cleanup handles additional interrupts gracefully."""
@@ -211,7 +281,7 @@ class TestCleanupIntegration:
         interrupt_handler.register_exit_callback(mock_interrupt_callback)
         
         # Test multiple interrupt levels
-        with patch('aris.cli.signal.signal'):
+        with patch('aris.interrupt_handler.signal.signal'):
             # Simulate first interrupt (should trigger cleanup)
             interrupt_handler._handle_interrupt(signal.SIGINT, None)
             
@@ -224,6 +294,75 @@ class TestCleanupIntegration:
         interrupt_handler.shutdown()
 
 
+class TestMainTaskSignals:
+    """Test that the console entry point turns SIGTERM into a clean task cancellation."""
+    
+    @pytest.mark.skipif(not hasattr(signal, "SIGTERM") or os.name == "nt", reason="requires Unix loop signal handlers")
+    def test_sigterm_cancels_main_task(self, monkeypatch):
+        from aris.__main__ import _run_main_task
+        monkeypatch.setattr("aris.cli._SHUTDOWN_REQUESTED", False)
+        
+        reached_cleanup = []
+        
+        async def long_running():
+            try:
+                os.kill(os.getpid(), signal.SIGTERM)
+                await asyncio.sleep(5)
+            finally:
+                reached_cleanup.append(True)
+        
+        loop = asyncio.new_event_loop()
+        try:
+            # Reports the termination instead of propagating CancelledError or killing the process
+            assert _run_main_task(loop, long_running()) is True
+        finally:
+            loop.close()
+        
+        assert reached_cleanup == [True]
+        # The orchestrator loop sees the request and ends the session
+        from aris.cli import is_shutdown_requested
+        assert is_shutdown_requested()
+    
+    def test_keyboard_interrupt_finishes_pending_main_task(self, monkeypatch):
+        from aris.__main__ import _run_main_task
+        monkeypatch.setattr("aris.cli._SHUTDOWN_REQUESTED", False)
+        
+        reached_cleanup = []
+        
+        def interrupt():
+            raise KeyboardInterrupt()
+        
+        async def long_running():
+            try:
+                asyncio.get_running_loop().call_soon(interrupt)
+                await asyncio.sleep(5)
+            finally:
+                reached_cleanup.append(True)
+        
+        loop = asyncio.new_event_loop()
+        try:
+            with pytest.raises(KeyboardInterrupt):
+                _run_main_task(loop, long_running())
+            # The task's cleanup ran before the interrupt propagated, not on a later loop run
+            assert reached_cleanup == [True]
+            assert not asyncio.all_tasks(loop)
+        finally:
+            loop.close()
+    
+    def test_completed_main_task_is_not_terminated(self, monkeypatch):
+        from aris.__main__ import _run_main_task
+        monkeypatch.setattr("aris.cli._SHUTDOWN_REQUESTED", False)
+        
+        async def quick():
+            return "done"
+        
+        loop = asyncio.new_event_loop()
+        try:
+            assert _run_main_task(loop, quick()) is False
+        finally:
+            loop.close()
+
+
 class TestSocketCleanup:
     """Test socket cleanup and port reuse functionality."""
     
@@ -289,8 +428,8 @@ class TestErrorHandling:
         with patch('aris.cli.log_error') as mock_log_error, \
              patch('aris.cli._workflow_mcp_server_started', True), \
              patch('aris.cli._profile_mcp_server_started', True), \
-             patch('aris.cli._workflow_mcp_server_thread', Mock()), \
-             patch('aris.cli._profile_mcp_server_thread', Mock()):
+             patch('aris.cli._workflow_uv_server', Mock()), \
+             patch('aris.cli._profile_uv_server', Mock()):
             
             # Test that cleanup completes even with errors
             await _shutdown_mcp_servers()
@@ -6,7 +6,7 @@ from unittest.mock import patch, MagicMock
 from pathlib import Path
 
 # Import the module/functions to test
-from aris import cli_args
+from aris import cli_args, logging_utils
 
 @pytest.fixture(autouse=True)
 def reset_cli_globals(monkeypatch):
@@ -53,7 +53,8 @@ def test_parse_arguments_and_configure_logging_defaults(
     mock_configure_logging.assert_called_once_with(
         enable_console_logging=False,
         log_file_path="aris_run.log",
-        workspace_path=None
+        workspace_path=None,
+        min_level=logging_utils.INFO
     )
     # Log file clearing is no longer done - timestamped files are created instead
     mock_write_text.assert_not_called()
@@ -92,7 +93,8 @@ def test_parse_arguments_custom_values(
     mock_configure_logging.assert_called_once_with(
         enable_console_logging=True,
         log_file_path=custom_log_filename,
-        workspace_path=None
+        workspace_path=None,
+        min_level=logging_utils.DEBUG
     )
     # Log file clearing is no longer done - timestamped files are created instead
     mock_write_text.assert_not_called()
@@ -115,7 +117,8 @@ def test_parse_arguments_log_clear_fails(
     mock_configure_logging.assert_called_once_with(
         enable_console_logging=False,
         log_file_path="aris_run.log",
-        workspace_path=None
+        workspace_path=None,
+        min_level=logging_utils.INFO
     )
     # Log file clearing is no longer done - timestamped files are created instead
     mock_write_text_raiser.assert_not_called()
@@ -131,4 +134,28 @@ def test_initialize_environment(mock_parse_args_log_config, mock_find_dotenv, mo
     # Verify that functions were called
     mock_load_dotenv.assert_called_once()
     mock_find_dotenv.assert_called_once()
-    mock_parse_args_log_config.assert_called_once()
\ No newline at end of file
+    mock_parse_args_log_config.assert_called_once()
+
+@patch("aris.cli_args.load_dotenv")
+@patch("aris.cli_args.find_dotenv")
+@patch("aris.cli_args.parse_arguments_and_configure_logging")
+def test_initialize_environment_runs_once(mock_parse_args_log_config, mock_find_dotenv, mock_load_dotenv):
+    first = cli_args.initialize_environment()
+    second = cli_args.initialize_environment()
+
+    assert second is first
+    mock_find_dotenv.assert_called_once()
+    mock_load_dotenv.assert_called_once()
+    mock_parse_args_log_config.assert_called_once()
+
+@patch("aris.cli_args.load_dotenv")
+@patch("aris.cli_args.find_dotenv")
+def test_initialize_environment_help_skips_dotenv(mock_find_dotenv, mock_load_dotenv, mock_sys_argv, capsys):
+    mock_sys_argv(["--help"])
+
+    with pytest.raises(SystemExit):
+        cli_args.initialize_environment()
+
+    mock_find_dotenv.assert_not_called()
+    mock_load_dotenv.assert_not_called()
+    assert "--workspace" in capsys.readouterr().out
@@ -43,7 +43,7 @@ def test_generate_allowed_tools_mcp_only(flag_manager: CLIFlagManager, create_mc
     ]
     # Override USER_DESIRED_NON_MCP_TOOLS for this specific test case
     original_user_tools = CLIFlagManager.USER_DESIRED_NON_MCP_TOOLS
-    CLIFlagManager.USER_DESIRED_NON_MCP_TOOLS = []
+    CLIFlagManager.USER_DESIRED_NON_MCP_TOOLS = frozenset()
 
     flags = flag_manager.generate_claude_cli_flags(mcp_schema)
     
@@ -63,7 +63,7 @@ def test_generate_allowed_tools_mcp_only(flag_manager: CLIFlagManager, create_mc
 
 def test_generate_allowed_tools_user_desired_only(flag_manager: CLIFlagManager, monkeypatch, create_mcp_json):
     # Use monkeypatch to temporarily modify class variable for this test
-    monkeypatch.setattr(CLIFlagManager, 'USER_DESIRED_NON_MCP_TOOLS', ["UserTool1", "UserTool2"])
+    monkeypatch.setattr(CLIFlagManager, 'USER_DESIRED_NON_MCP_TOOLS', frozenset({"UserTool1", "UserTool2"}))
     
     flags = flag_manager.generate_claude_cli_flags([]) # No MCP tools
         
@@ -78,7 +78,7 @@ def test_generate_allowed_tools_mixed_mcp_and_user(flag_manager: CLIFlagManager,
     mcp_schema = [
         {"name": "mcp_main"}
     ]
-    monkeypatch.setattr(CLIFlagManager, 'USER_DESIRED_NON_MCP_TOOLS', ["UserHelper", "WebSearch"])
+    monkeypatch.setattr(CLIFlagManager, 'USER_DESIRED_NON_MCP_TOOLS', frozenset({"UserHelper", "WebSearch"}))
     
     flags = flag_manager.generate_claude_cli_flags(mcp_schema)
     
@@ -96,7 +96,7 @@ def test_generate_allowed_tools_mixed_mcp_and_user(flag_manager: CLIFlagManager,
     assert tools_string == ",".join(expected_tools)
 
 def test_generate_allowed_tools_no_mcp_no_user(flag_manager: CLIFlagManager, monkeypatch, create_mcp_json):
-    monkeypatch.setattr(CLIFlagManager, 'USER_DESIRED_NON_MCP_TOOLS', [])
+    monkeypatch.setattr(CLIFlagManager, 'USER_DESIRED_NON_MCP_TOOLS', frozenset())
     flags = flag_manager.generate_claude_cli_flags([])
     
     # --allowedTools flag should not be present if no tools are found
@@ -109,7 +109,7 @@ def test_generate_allowed_tools_duplicates_handled(flag_manager: CLIFlagManager,
     mcp_schema = [
         {"name": "user_tool"} # This will become "mcp__aigentive__user_tool"
     ]
-    monkeypatch.setattr(CLIFlagManager, 'USER_DESIRED_NON_MCP_TOOLS', ["user_tool", "another_tool"])
+    monkeypatch.setattr(CLIFlagManager, 'USER_DESIRED_NON_MCP_TOOLS', frozenset({"user_tool", "another_tool"}))
     
     flags = flag_manager.generate_claude_cli_flags(mcp_schema)
     
@@ -132,6 +132,87 @@ def test_generate_allowed_tools_duplicates_handled(flag_manager: CLIFlagManager,
     ])
     assert tools_string == ",".join(expected_tools)
 
+def test_default_native_tools_exclude_bash_marker(flag_manager: CLIFlagManager):
+    flags = flag_manager.generate_claude_cli_flags([])
+    
+    tools = flags[flags.index(flag_manager.ALLOWED_TOOLS_FLAG) + 1].split(",")
+    assert set(tools) == CLIFlagManager.USER_DESIRED_NON_MCP_TOOLS - {"Bash"}
+
+def test_tool_preferences_resolve_against_available_servers(flag_manager: CLIFlagManager, monkeypatch):
+    mcp_schema = [
+        {"name": "getVideo", "server_name": "youtube"},
+        {"name": "search", "server_name": "youtube"},
+        {"name": "query", "server_name": "db"},
+    ]
+    monkeypatch.setattr(CLIFlagManager, 'USER_DESIRED_NON_MCP_TOOLS', frozenset({"Read"}))
+    
+    flags = flag_manager.generate_claude_cli_flags(
+        mcp_schema,
+        tool_preferences=["youtube", "query", "Read", "Bash(git status)", "Unknown"]
+    )
+    
+    tools_string = flags[flags.index(flag_manager.ALLOWED_TOOLS_FLAG) + 1]
+    assert tools_string.split(",") == sorted([
+        "mcp__youtube__getVideo",  # every tool of a server named as a preference
+        "mcp__youtube__search",
+        "mcp__db__query",  # bare tool name resolved to its server prefix
+        "Read",
+        "Bash(git status)",
+        "Unknown",  # unresolved preferences pass through unprefixed
+    ])
+
+def test_bare_tool_preference_keeps_double_underscores(flag_manager: CLIFlagManager, monkeypatch):
+    mcp_schema = [{"name": "list__items", "server_name": "db"}, {"name": "query", "server_name": "db"}]
+    monkeypatch.setattr(CLIFlagManager, 'USER_DESIRED_NON_MCP_TOOLS', frozenset())
+    
+    flags = flag_manager.generate_claude_cli_flags(mcp_schema, tool_preferences=["list__items"])
+    
+    assert flags[flags.index(flag_manager.ALLOWED_TOOLS_FLAG) + 1] == "mcp__db__list__items"
+
+def test_mcp_config_data_from_caller_skips_reparse(flag_manager: CLIFlagManager, create_mcp_json):
+    config_data = {"mcpServers": {"youtube": {}}}
+    
+    with patch("builtins.open", side_effect=AssertionError("config file re-read")):
+        flags = flag_manager.generate_claude_cli_flags(
+            [], mcp_config_path=str(create_mcp_json), mcp_config_data=config_data
+        )
+    
+    mcp_config_flag_index = flags.index(flag_manager.MCP_CONFIG_FLAG)
+    assert flags[mcp_config_flag_index + 1] == str(create_mcp_json)
+    assert flag_manager._current_mcp_config_data is config_data
+
+def test_mcp_config_file_parsed_once_until_changed(flag_manager: CLIFlagManager, create_mcp_json):
+    import json as json_module
+    
+    with patch("json.load", side_effect=json_module.load) as mock_load:
+        flag_manager.generate_claude_cli_flags([], mcp_config_path=str(create_mcp_json))
+        flag_manager.generate_claude_cli_flags([], mcp_config_path=str(create_mcp_json))
+        assert mock_load.call_count == 1
+        
+        create_mcp_json.write_text('{"mcpServers": {"youtube": {}}}')
+        flags = flag_manager.generate_claude_cli_flags([], mcp_config_path=str(create_mcp_json))
+    
+    assert mock_load.call_count == 2
+    assert flag_manager.MCP_CONFIG_FLAG in flags
+    assert flag_manager._current_mcp_config_data == {"mcpServers": {"youtube": {}}}
+
+@patch("aris.profile_manager.profile_manager.get_merged_mcp_config_path")
+def test_profile_mcp_config_merged_once_per_profile(mock_merge, flag_manager: CLIFlagManager, create_mcp_json):
+    mock_merge.return_value = str(create_mcp_json)
+    profile = {"profile_name": "dev", "mcp_config_files": ["a.json"]}
+    
+    assert flag_manager._get_profile_mcp_config_path(profile) == str(create_mcp_json)
+    assert flag_manager._get_profile_mcp_config_path(profile) == str(create_mcp_json)
+    assert mock_merge.call_count == 1
+    
+    # A newly activated profile, or a merged file that has since been removed, merges again
+    flag_manager._get_profile_mcp_config_path(dict(profile))
+    assert mock_merge.call_count == 2
+    create_mcp_json.unlink()
+    flag_manager._get_profile_mcp_config_path(profile)
+    flag_manager._get_profile_mcp_config_path(profile)
+    assert mock_merge.call_count == 4
+
 @patch("aris.cli_flag_manager.log_router_activity") # Mock log_router_activity
 def test_mcp_config_path_resolution_no_file(mock_log_router_activity: MagicMock, flag_manager: CLIFlagManager, tmp_path: Path):
     # flag_manager is initialized with tmp_path
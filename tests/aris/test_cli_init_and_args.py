@@ -114,4 +114,118 @@ async def test_fully_initialize_app_components_called_multiple_times(
     assert cli._APP_INITIALIZED is True
 
     await cli.fully_initialize_app_components() # Second call # Await
-    assert mock_init_router.call_count == 1 # Should not be called again
\ No newline at end of file
+    assert mock_init_router.call_count == 1 # Should not be called again
+
+@pytest.mark.asyncio
+@patch("aris.orchestrator.initialize_router_components")
+@patch("aris.cli.initialize_environment")
+@patch("aris.cli.log_error")
+async def test_fully_initialize_app_components_picks_up_parsed_args(
+    mock_log_error, mock_init_env, mock_init_router, monkeypatch
+):
+    # cli imported PARSED_ARGS before argument parsing; it should sync from cli_args, not re-parse
+    parsed = argparse.Namespace(speak=False, voice=True, no_profile_mcp_server=False, profile_mcp_port=8092)
+    monkeypatch.setattr(cli, 'PARSED_ARGS', None)
+    monkeypatch.setattr(cli, 'INITIAL_VOICE_MODE', False)
+    monkeypatch.setattr(cli, 'TRIGGER_WORDS', [])
+    monkeypatch.setattr(cli_args, 'PARSED_ARGS', parsed)
+    monkeypatch.setattr(cli_args, 'INITIAL_VOICE_MODE', True)
+    monkeypatch.setattr(cli_args, 'TRIGGER_WORDS', ["hey"])
+
+    await cli.fully_initialize_app_components()
+
+    mock_init_env.assert_not_called()
+    mock_log_error.assert_not_called()
+    assert cli.PARSED_ARGS is parsed
+    assert cli.INITIAL_VOICE_MODE is True
+    assert cli.TRIGGER_WORDS == ["hey"]
+    assert cli._APP_INITIALIZED is True
+
+@pytest.mark.asyncio
+@patch("aris.orchestrator.initialize_router_components")
+@patch("aris.mcp_startup_analyzer.MCPStartupAnalyzer.should_start_workflow_mcp_server", return_value=True)
+@patch("aris.mcp_startup_analyzer.MCPStartupAnalyzer.should_start_profile_mcp_server", return_value=True)
+async def test_fully_initialize_app_components_starts_mcp_servers_concurrently(
+    mock_should_profile, mock_should_workflow, mock_init_router, monkeypatch
+):
+    import asyncio
+    monkeypatch.setattr(cli, 'PARSED_ARGS', argparse.Namespace(speak=False, voice=False, no_profile_mcp_server=False, profile_mcp_port=8092))
+    monkeypatch.setattr(cli, 'INITIAL_VOICE_MODE', False)
+
+    # Each fake startup waits for the other to begin; a sequential await would time out
+    profile_started = asyncio.Event()
+    workflow_started = asyncio.Event()
+    completed = []
+
+    async def fake_profile_start():
+        profile_started.set()
+        await asyncio.wait_for(workflow_started.wait(), timeout=1.0)
+        completed.append("profile")
+
+    async def fake_workflow_start():
+        workflow_started.set()
+        await asyncio.wait_for(profile_started.wait(), timeout=1.0)
+        completed.append("workflow")
+
+    monkeypatch.setattr(cli, '_start_profile_mcp_server', fake_profile_start)
+    monkeypatch.setattr(cli, '_start_workflow_mcp_server', fake_workflow_start)
+
+    await cli.fully_initialize_app_components()
+
+    assert sorted(completed) == ["profile", "workflow"]
+    assert cli._APP_INITIALIZED is True
+
+@pytest.mark.asyncio
+@patch("aris.orchestrator.initialize_router_components")
+async def test_fully_initialize_app_components_caches_verbose_flag(mock_init_router, monkeypatch):
+    monkeypatch.setattr(cli, 'PARSED_ARGS', argparse.Namespace(speak=False, voice=False, verbose=True, no_profile_mcp_server=True, no_workflow_mcp_server=True, profile_mcp_port=8092))
+    monkeypatch.setattr(cli, 'INITIAL_VOICE_MODE', False)
+    monkeypatch.setattr(cli, '_VERBOSE', False)
+    monkeypatch.setattr(cli, '_STARTUP_PROFILE', "stale")
+
+    with patch("builtins.print"):
+        await cli.fully_initialize_app_components()
+
+    assert cli._VERBOSE is True
+    # No --profile on the namespace falls back to the default profile
+    assert cli._STARTUP_PROFILE == "default"
+
+def test_importing_cli_skips_interactive_only_modules():
+    import subprocess
+    import sys
+    # A fresh interpreter is needed because other tests import these modules directly
+    code = (
+        "import sys, aris.cli; "
+        "print(sorted(m for m in ('aris.interaction_handler', 'aris.voice_handler') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+def test_mode_banners_are_built_once_per_profile():
+    assert cli._text_mode_banner("dev") is cli._text_mode_banner("dev")
+    assert cli._text_mode_banner("dev") is not cli._text_mode_banner("ops")
+    banner = cli._voice_mode_banner("dev", " Say '/voice off' to switch. Ctrl+C to exit.")
+    assert banner[0] == ("bold fg:magenta", "🎙️ Voice mode enabled with profile 'dev'.")
+
+@pytest.mark.asyncio
+@patch("aris.orchestrator.initialize_router_components")
+@patch("aris.cli.activate_profile")
+@patch("aris.cli.profile_manager.get_profile", return_value={"profile_name": "default"})
+@patch("aris.cli.workspace_manager.setup_workspace", return_value="/orig")
+@patch("aris.cli.workspace_manager.resolve_workspace_path", return_value="/work/proj")
+async def test_fully_initialize_app_components_resolves_profile_with_workspace_variables(
+    mock_resolve_ws, mock_setup_ws, mock_get_profile, mock_activate, mock_init_router, monkeypatch
+):
+    monkeypatch.setattr(cli, 'PARSED_ARGS', argparse.Namespace(
+        speak=False, voice=False, no_profile_mcp_server=True, no_workflow_mcp_server=True,
+        profile_mcp_port=8092, workspace="proj"
+    ))
+
+    await cli.fully_initialize_app_components()
+
+    # The startup profile gets the same workspace variables as a /profile switch
+    assert mock_get_profile.call_args.kwargs["workspace_variables"] == {
+        "workspace": "/work/proj", "workspace_name": "proj"
+    }
+    mock_activate.assert_called_once()
+    assert mock_activate.call_args.kwargs["resolved_profile"] == {"profile_name": "default"}
@@ -192,6 +192,19 @@ class TestCliInsightsFlag:
         assert "🤖 test_profile: Task completed successfully" in result
         assert "📈 Session metrics:" not in result
     
+    def test_format_response_skips_summary_without_metrics(self):
+        """Test that the completion summary is not built when no activity was recorded."""
+        session_state = MagicMock()
+        session_state.active_profile = {"profile_name": "test_profile"}
+        
+        progress_tracker = MagicMock()
+        progress_tracker.has_metrics.return_value = False
+        
+        result = format_non_interactive_response("Task completed successfully", session_state, progress_tracker)
+        
+        assert "📈 Session metrics:" not in result
+        progress_tracker.get_completion_summary.assert_not_called()
+    
     def test_format_response_with_low_cost_operations(self):
         """Test that low-cost operations don't show metrics footer."""
         session_state = MagicMock()
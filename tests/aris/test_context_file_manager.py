@@ -53,6 +53,35 @@ def test_prepare_embedded_context(context_manager, temp_context_files):
     assert "This is test content for context file 1" in embedded_content
     assert "This is test content for context file 2" in embedded_content
 
+def test_prepare_embedded_context_is_cached_until_files_change(context_manager, temp_context_files):
+    """Test that embedded content is reused until a context file changes."""
+    temp_dir, context_files = temp_context_files
+    
+    first = context_manager.prepare_embedded_context(context_files)
+    assert context_manager.prepare_embedded_context(context_files) is first
+    
+    with open(context_files[1], 'a') as f:
+        f.write("\n\nAdditional content.")
+    
+    updated = context_manager.prepare_embedded_context(context_files)
+    assert updated is not first
+    assert "Additional content." in updated
+
+def test_prepare_embedded_context_reads_large_files_like_small_ones(context_manager, temp_context_files, monkeypatch):
+    """Test that the mmap path for large files matches a text-mode read."""
+    from aris import context_file_manager as cfm
+    temp_dir, context_files = temp_context_files
+    with open(context_files[0], 'wb') as f:
+        f.write("line one\r\nligne deux é\rline three\n".encode('utf-8'))
+    
+    small = context_manager.prepare_embedded_context(context_files[:1])
+    context_manager._embedded_cache.clear()
+    monkeypatch.setattr(cfm, "_MMAP_READ_THRESHOLD", 0)
+    large = context_manager.prepare_embedded_context(context_files[:1])
+    
+    assert large == small
+    assert "line one\nligne deux é\nline three\n" in large
+
 def test_generate_context_file(context_manager, temp_context_files):
     """Test generating a consolidated context file."""
     temp_dir, context_files = temp_context_files
@@ -74,6 +103,70 @@ def test_generate_context_file(context_manager, temp_context_files):
     assert "This is test content for context file 1" in content
     assert "This is test content for context file 2" in content
 
+def test_generate_context_file_copies_content_and_reports_missing(context_manager, temp_context_files):
+    """Test that UTF-8 source content is copied unchanged and unreadable files get an error section."""
+    temp_dir, context_files = temp_context_files
+    missing = os.path.join(temp_dir, "missing.md")
+    
+    consolidated_path = context_manager.generate_context_file(context_files + [missing], "test-session")
+    
+    with open(consolidated_path, 'rb') as f:
+        content = f.read()
+    with open(context_files[0], 'rb') as f:
+        source = f.read()
+    
+    assert b"\n\n## context1\n\n" + source + b"\n\n---\n\n" in content
+    assert f"## ERROR: Failed to include {missing}".encode('utf-8') in content
+
+def test_generate_context_file_sanitizes_session_id(context_manager, temp_context_files):
+    """Test that unsafe characters are stripped from the session ID in the file name."""
+    temp_dir, context_files = temp_context_files
+    
+    safe_path = context_manager.generate_context_file(context_files, "abc-123_x")
+    assert os.path.basename(safe_path).startswith("context_abc-123_x_")
+    
+    context_manager.temp_files.clear()
+    unsafe_path = context_manager.generate_context_file(context_files, "../ab c/é")
+    assert os.path.dirname(unsafe_path) == context_manager.base_temp_dir
+    assert os.path.basename(unsafe_path).startswith("context_abc_")
+
+def test_generate_context_file_reads_files_over_the_prefetch_limit(context_manager, temp_context_files, monkeypatch):
+    """Test that files too large to prefetch are read separately and still appear in order."""
+    from aris import context_file_manager as cfm
+    temp_dir, context_files = temp_context_files
+    monkeypatch.setattr(cfm, "_COPY_BUFFER_SIZE", 100)
+    with open(context_files[1], 'a') as f:
+        f.write(" padding" * 20)
+    
+    consolidated_path = context_manager.generate_context_file(context_files, "test-session")
+    
+    with open(consolidated_path, 'r') as f:
+        content = f.read()
+    assert content.index("## context1") < content.index("## context2")
+    assert content.count("padding") == 20
+
+@pytest.mark.parametrize("prefetch_limit", [1 << 20, 0])
+def test_generate_context_file_normalizes_newlines_and_rejects_non_utf8(context_manager, temp_context_files, monkeypatch, prefetch_limit):
+    """Test that both read paths translate CRLF like a text-mode read and report non-UTF-8 files."""
+    from aris import context_file_manager as cfm
+    temp_dir, context_files = temp_context_files
+    monkeypatch.setattr(cfm, "_COPY_BUFFER_SIZE", prefetch_limit)
+    crlf_file = os.path.join(temp_dir, "crlf.md")
+    with open(crlf_file, 'wb') as f:
+        f.write("line one\r\nligne deux é\rline three\r\n".encode('utf-8'))
+    latin1_file = os.path.join(temp_dir, "latin1.md")
+    with open(latin1_file, 'wb') as f:
+        f.write("caf\u00e9".encode('latin-1'))
+    
+    consolidated_path = context_manager.generate_context_file([crlf_file, latin1_file], "test-session")
+    
+    with open(consolidated_path, 'rb') as f:
+        content = f.read()
+    assert "## crlf\n\nline one\nligne deux é\nline three\n".encode('utf-8') in content
+    assert b"\r" not in content
+    assert f"## ERROR: Failed to include {latin1_file}".encode('utf-8') in content
+    assert b"caf\xe9" not in content
+
 def test_estimate_context_size(context_manager, temp_context_files):
     """Test estimating the total size of context files."""
     temp_dir, context_files = temp_context_files
@@ -87,6 +180,14 @@ def test_estimate_context_size(context_manager, temp_context_files):
     # Check that the estimated size matches the expected size
     assert estimated_size == expected_size
 
+def test_estimate_context_size_skips_missing_files(context_manager, temp_context_files):
+    """Test that missing files and missing directories add nothing to the estimate."""
+    temp_dir, context_files = temp_context_files
+    paths = context_files + [os.path.join(temp_dir, "missing.md"), os.path.join(temp_dir, "nodir", "x.md")]
+    
+    expected_size = sum(os.path.getsize(file) for file in context_files)
+    assert context_manager.estimate_context_size(paths) == expected_size
+
 def test_context_file_caching(context_manager, temp_context_files):
     """Test that context files are cached correctly."""
     temp_dir, context_files = temp_context_files
@@ -109,6 +210,29 @@ def test_context_file_caching(context_manager, temp_context_files):
     # The path should be different since the file content changed
     assert path3 != path1
 
+def test_context_signature_skips_missing_files(context_manager, temp_context_files):
+    """Test that missing files are left out of the context signature."""
+    temp_dir, context_files = temp_context_files
+    missing = os.path.join(temp_dir, "missing.md")
+    
+    signature = context_manager._context_signature(context_files + [missing])
+    assert signature == context_manager._context_signature(context_files)
+    assert [entry[0] for entry in signature] == context_files
+    assert signature[0][2] == os.path.getsize(context_files[0])
+
+def test_context_file_cache_keeps_one_entry_per_file_list(context_manager, temp_context_files):
+    """Test that regenerating after a change replaces the cached entry for the same files."""
+    temp_dir, context_files = temp_context_files
+    
+    path1 = context_manager.generate_context_file(context_files, "test-session")
+    with open(context_files[0], 'a') as f:
+        f.write("\n\nAdditional content.")
+    path2 = context_manager.generate_context_file(context_files, "test-session")
+    
+    assert path2 != path1
+    assert list(context_manager.temp_files) == [tuple(context_files)]
+    assert context_manager.temp_files[tuple(context_files)][0] == path2
+
 def test_cleanup_old_files(context_manager, monkeypatch):
     """Test cleaning up old temporary files."""
     import time
@@ -122,20 +246,39 @@ def test_cleanup_old_files(context_manager, monkeypatch):
     with open(old_file, 'w') as f:
         f.write("Old file content")
     
-    # Mock os.path.getctime to return different creation times
+    # Wrap os.scandir so each entry reports a different creation time
     # This ensures we don't rely on actual file system timestamps
-    def mock_getctime(path):
-        if "recent" in path:
-            return time.time() - 1 * 3600  # 1 hour ago
-        else:
-            return time.time() - 25 * 3600  # 25 hours ago
+    real_scandir = os.scandir
+    
+    class AgedEntry:
+        def __init__(self, entry):
+            self._entry = entry
+            self.name = entry.name
+            self.path = entry.path
+        
+        def is_file(self):
+            return self._entry.is_file()
+        
+        def stat(self):
+            hours = 1 if "recent" in self.name else 25
+            return os.stat_result((0,) * 9 + (time.time() - hours * 3600,))
+    
+    class AgedScandir:
+        def __init__(self, path):
+            self._it = real_scandir(path)
+        
+        def __enter__(self):
+            return (AgedEntry(entry) for entry in self._it)
+        
+        def __exit__(self, *exc):
+            self._it.close()
     
     # Apply the mock
-    monkeypatch.setattr(os.path, "getctime", mock_getctime)
+    monkeypatch.setattr(os, "scandir", AgedScandir)
     
     # Register the old file in the manager's temp_files mapping for better coverage
     # This simulates the file being created by generate_context_file
-    context_manager.temp_files["test_hash"] = old_file
+    context_manager.temp_files[("old.md",)] = (old_file, ())
     
     # Run cleanup with 24 hour threshold
     context_manager.cleanup_old_files(max_age_hours=24)
@@ -145,4 +288,4 @@ def test_cleanup_old_files(context_manager, monkeypatch):
     
     # Check that the old file was deleted and removed from cache
     assert not os.path.exists(old_file)
-    assert "test_hash" not in context_manager.temp_files
\ No newline at end of file
+    assert ("old.md",) not in context_manager.temp_files
\ No newline at end of file
@@ -5,6 +5,7 @@ These tests are MANDATORY to ensure no functionality is lost in non-interactive
 Every core feature MUST have identical behavior between the two modes.
 """
 import pytest
+import json
 import os
 import sys
 import tempfile
@@ -82,6 +83,77 @@ class TestResponseParsing:
         result = parse_claude_response_stream(chunks)
         assert result == "Starting task... completed!"
     
+    def test_parse_with_stdlib_json_fallback(self):
+        """Parsing should behave identically when orjson is unavailable."""
+        chunks = [
+            '{"type": "text", "text": "Good"}',
+            'invalid json',
+            '{"type": "result", "result": "Final answer"}',
+        ]
+        
+        with patch('aris.cli._json_loads', json.loads):
+            result = parse_claude_response_stream(chunks)
+        
+        assert result == "Final answer"
+    
+    def test_parse_skips_tool_use_without_decoding(self):
+        """Top-level tool_use events should be skipped before JSON decoding."""
+        chunks = [
+            '{"type":"tool_use","name":"big_tool","input":{"payload":"x"}}',
+            '{"type": "tool_use", "name": "test_tool", "input": {}}',
+            '{"type": "text", "text": "done"}',
+        ]
+        
+        result = parse_claude_response_stream(chunks)
+        assert result == "done"
+    
+    def test_parse_skips_user_and_system_events_without_decoding(self):
+        """Tool results (user events) and system events are skipped from their type prefix."""
+        chunks = [
+            '{"type":"system","subtype":"init","tools":["a","b"]}',
+            '{"type":"user","message":{"content":[{"type":"tool_result","content":"big output"}]}}',
+            '{"type":"assistant","message":{"content":[{"type":"text","text":"answer"}]}}',
+        ]
+        
+        with patch('aris.cli._json_loads', side_effect=json.loads) as mock_loads:
+            result = parse_claude_response_stream(chunks)
+        
+        assert result == "answer"
+        assert mock_loads.call_count == 1
+    
+    def test_parse_skips_non_object_chunks_without_decoding(self):
+        """Blank and plain-text chunks are skipped before JSON decoding."""
+        chunks = [
+            '',
+            '   ',
+            'invalid json',
+            '{"type": "text", "text": "kept"}',
+        ]
+        
+        with patch('aris.cli._json_loads', side_effect=json.loads) as mock_loads:
+            result = parse_claude_response_stream(chunks)
+        
+        assert result == "kept"
+        assert mock_loads.call_count == 1
+    
+    def test_parse_assistant_with_nested_tool_use(self):
+        """Assistant messages containing tool_use items must still be decoded."""
+        chunks = [
+            '{"type":"assistant","message":{"content":[{"type":"tool_use","name":"t"},{"type":"text","text":"kept"}]}}',
+        ]
+        
+        result = parse_claude_response_stream(chunks)
+        assert result == "kept"
+    
+    def test_parse_assistant_with_multiple_text_items(self):
+        """A single assistant chunk may contribute more fragments than there are chunks."""
+        chunks = [
+            '{"type":"assistant","message":{"content":[{"type":"text","text":"one "},{"type":"text","text":"two "},{"type":"text","text":"three"}]}}',
+        ]
+        
+        result = parse_claude_response_stream(chunks)
+        assert result == "one two three"
+    
     def test_parse_error_response(self):
         """Error responses should raise exceptions identically."""
         chunks = [
@@ -245,6 +317,27 @@ class TestClaudeCLIIntegrationParity:
             
             assert result == "Hello world!"
     
+    @pytest.mark.asyncio
+    async def test_single_turn_drains_stream_before_raising_error(self):
+        """An error event is raised only after route() has been fully consumed."""
+        session_state = SessionState()
+        consumed = []
+        
+        with patch('aris.orchestrator.route') as mock_route:
+            async def mock_async_iter():
+                for chunk in ['{"type": "text", "text": "partial"}',
+                              '{"type": "error", "error": {"message": "boom"}}',
+                              '{"type": "result", "result": "ignored"}']:
+                    consumed.append(chunk)
+                    yield chunk
+            
+            mock_route.return_value = mock_async_iter()
+            
+            with pytest.raises(RuntimeError, match="Claude error: boom"):
+                await execute_single_turn("hi", session_state)
+        
+        assert len(consumed) == 3
+    
     def test_flag_generation_identical(self):
         """Claude CLI flag generation must be identical."""
         # Test that flags are generated the same way
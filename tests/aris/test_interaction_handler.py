@@ -58,6 +58,40 @@ async def test_spinner_task(mock_stop_event, monkeypatch):
     # The last call should be to clear the spinner line
     mock_write.assert_called_with('\r' + ' ' * (len("Thinking...") + 2) + '\r')
 
+@pytest.mark.asyncio
+async def test_spinner_task_writes_one_frame_per_tick_and_slows_without_tty(mock_stop_event, monkeypatch):
+    """Test that each spinner tick is one write and non-TTY output uses the slower delay."""
+    from aris import interaction_handler
+    mock_write = MagicMock()
+    monkeypatch.setattr("sys.stdout.write", mock_write)
+    monkeypatch.setattr("sys.stdout.flush", MagicMock())
+    monkeypatch.setattr("sys.stdout.isatty", lambda: False)
+    
+    delays = []
+    async def fake_sleep(delay):
+        delays.append(delay)
+        if len(delays) == 2:
+            mock_stop_event.set()
+    
+    with patch("aris.interaction_handler.asyncio.sleep", fake_sleep):
+        await spinner_task(mock_stop_event, "Thinking...")
+    
+    assert delays == [interaction_handler.NON_TTY_SPINNER_DELAY] * 2
+    assert [c.args[0] for c in mock_write.call_args_list[:2]] == ["\rThinking...| ", "\rThinking.../ "]
+
+@pytest.mark.asyncio
+async def test_spinner_task_stopped_during_initial_delay_writes_nothing(mock_stop_event, monkeypatch):
+    """Test that a spinner stopped before its first frame never touches stdout."""
+    mock_write = MagicMock()
+    monkeypatch.setattr("sys.stdout.write", mock_write)
+    
+    task = asyncio.create_task(spinner_task(mock_stop_event, "Thinking...", initial_delay=5.0))
+    await asyncio.sleep(0)
+    mock_stop_event.set()
+    await asyncio.wait_for(task, timeout=1.0)
+    
+    mock_write.assert_not_called()
+
 @pytest.mark.asyncio
 async def test_start_and_stop_spinner():
     """Test the start_spinner and stop_spinner functions."""
@@ -312,4 +346,33 @@ def test_print_welcome_message(mock_print_formatted_text):
     print_welcome_message("test_profile")
     
     # Verify that print_formatted_text was called twice more
-    assert mock_print_formatted_text.call_count == 4
\ No newline at end of file
+    assert mock_print_formatted_text.call_count == 4
+
+def test_interaction_handler_reuses_loaded_cli_style():
+    """Test that the module picks up the style from the already-loaded CLI module."""
+    from aris import cli, interaction_handler
+    assert interaction_handler.cli_style is cli.cli_style
+
+@pytest.mark.asyncio
+@patch("aris.cli_args.TEXT_MODE_TTS_ENABLED", False)
+@patch("aris.interaction_handler.start_spinner", return_value=(MagicMock(), MagicMock()))
+@patch("aris.interaction_handler.stop_spinner")
+@patch("aris.interaction_handler.print_formatted_text")
+@patch("aris.orchestrator.route")
+async def test_handle_route_chunks_detects_reference_file_read(
+    mock_route, mock_print, mock_stop_spinner, mock_start_spinner
+):
+    """Test that a confirmation mentioning the reference file marks it as read."""
+    async def mock_route_gen(*args, **kwargs):
+        yield json.dumps({"type": "assistant", "message": {"content": [
+            {"type": "text", "text": "The Reference File is loaded.\nI have READ it."}
+        ]}})
+    mock_route.return_value = mock_route_gen()
+    
+    session_state = SessionState(session_id="test123")
+    session_state.reference_file_path = "/tmp/context_ref.md"
+    
+    with patch.object(SessionState, "is_first_message", return_value=True):
+        await handle_route_chunks("Hello", session_state, "Thinking...")
+    
+    assert session_state.has_read_reference_file is True
@@ -77,6 +77,22 @@ class TestInterruptHandler:
         handler.set_context(InterruptContext.IDLE)
         assert handler.current_context == InterruptContext.IDLE
     
+    def test_context_switching_reinstalls_replaced_signal_handler(self):
+        """Test that every context change restores the SIGINT handler if it was replaced."""
+        handler = InterruptHandler()
+        
+        with patch('signal.getsignal', return_value=signal.default_int_handler) as mock_getsignal, \
+                patch('signal.signal') as mock_signal:
+            handler.set_context(InterruptContext.CLAUDE_THINKING)
+            handler.set_context(InterruptContext.IDLE)
+            assert mock_getsignal.call_count == 2
+            assert mock_signal.call_count == 2
+            mock_signal.assert_called_with(signal.SIGINT, handler._handle_interrupt)
+        
+        with patch('signal.getsignal', return_value=handler._handle_interrupt), patch('signal.signal') as mock_signal:
+            handler.set_context(InterruptContext.TTS_PLAYING)
+            mock_signal.assert_not_called()
+    
     def test_callback_registration(self):
         """Test callback registration for different contexts."""
         handler = InterruptHandler()
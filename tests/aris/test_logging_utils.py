@@ -203,4 +203,82 @@ def test_initial_configure_logging_fails_to_write(capsys, monkeypatch, tmp_path)
     # Check for key parts - now checking for the timestamped file path pattern
     assert "[LOGGING_ERROR] INITIALIZATION: Failed to write to log file" in stderr_output
     assert str(log_file.with_suffix('')) in stderr_output  # Base path should be in there
-    assert "Cannot write initial config" in stderr_output 
\ No newline at end of file
+    assert "Cannot write initial config" in stderr_output 
+
+def test_log_functions_defer_percent_formatting(temp_log_file: Path):
+    logging_utils.log_debug("About to exit with code: %s", 3)
+    logging_utils.log_router_activity("Started %s on port %d", "server", 8094)
+    logging_utils.log_warning("Progress at 100%")  # No args: message is written verbatim
+    
+    file_content = temp_log_file.read_text()
+    assert "[DEBUG] About to exit with code: 3" in file_content
+    assert "[ROUTER_ACTIVITY] Started server on port 8094" in file_content
+    assert "[WARNING] Progress at 100%" in file_content
+
+def test_log_functions_keep_record_on_bad_format_args(temp_log_file: Path, capsys):
+    logging_utils.log_warning("Expected %d items", "three")  # TypeError
+    logging_utils.log_info("Value: %s %s", 1)  # Too few args
+    
+    file_content = temp_log_file.read_text()
+    assert "[WARNING] Expected %d items ('three',)" in file_content
+    assert "[INFO] Value: %s %s (1,)" in file_content
+    assert "Failed to write to log file" not in strip_ansi(capsys.readouterr().err)
+
+def test_log_file_is_opened_once_across_records(temp_log_file: Path, monkeypatch):
+    original_os_open = os.open
+    opened = []
+    
+    def counting_os_open(path, *args, **kwargs):
+        opened.append(path)
+        return original_os_open(path, *args, **kwargs)
+    
+    monkeypatch.setattr(logging_utils.os, "open", counting_os_open)
+    logging_utils.log_info("first")
+    logging_utils.log_info("second")
+    
+    assert opened == [str(temp_log_file)]
+    file_content = temp_log_file.read_text()
+    assert "[INFO] first" in file_content and "[INFO] second" in file_content
+    
+    # A new target path gets its own descriptor
+    other = temp_log_file.with_name("other.log")
+    monkeypatch.setattr(logging_utils, '_LOG_FILE_PATH', str(other))
+    logging_utils.log_info("third")
+    assert opened == [str(temp_log_file), str(other)]
+    assert "[INFO] third" in other.read_text()
+
+def test_records_below_min_level_are_skipped(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(logging_utils, '_MIN_LEVEL', logging_utils.DEBUG)  # restored after the test
+    log_file = tmp_path / "min_level.log"
+    logging_utils.configure_logging(enable_console_logging=False, log_file_path=str(log_file), min_level=logging_utils.WARNING)
+    
+    def fail_dumps(*args, **kwargs):
+        raise AssertionError("tool call serialized below the minimum level")
+    
+    with monkeypatch.context() as m:
+        m.setattr(logging_utils.json, "dumps", fail_dumps)
+        logging_utils.log_tool_call("my_tool", {"arg": "val"})
+    logging_utils.log_debug("hidden debug %s", 1)
+    logging_utils.log_router_activity("hidden activity")
+    logging_utils.log_warning("shown warning")
+    logging_utils.log_error("shown error")
+    
+    file_content = Path(logging_utils._LOG_FILE_PATH).read_text()
+    assert "hidden" not in file_content and "my_tool" not in file_content
+    assert "[WARNING] shown warning" in file_content
+    assert "[ERROR] shown error" in file_content
+
+def test_logging_while_the_write_lock_is_held_does_not_deadlock(temp_log_file: Path):
+    # Simulates a signal handler logging on the main thread in the middle of a log write
+    import threading
+    
+    def log_inside_lock():
+        with logging_utils._LOG_WRITE_LOCK:
+            logging_utils.log_router_activity("from the signal handler")
+    
+    worker = threading.Thread(target=log_inside_lock, daemon=True)
+    worker.start()
+    worker.join(timeout=2.0)
+    
+    assert not worker.is_alive()
+    assert "[ROUTER_ACTIVITY] from the signal handler" in temp_log_file.read_text()
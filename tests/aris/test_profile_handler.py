@@ -431,6 +431,23 @@ def test_activate_profile_success(
     # Verify that print_formatted_text was called
     assert mock_print.call_count >= 1  # At least one call for the activation message
 
+@patch("aris.profile_handler.profile_manager")
+@patch("aris.profile_handler.collect_template_variables", return_value={})
+@patch("aris.profile_handler.set_current_session_state")
+@patch("aris.profile_handler.print_formatted_text")
+def test_activate_profile_uses_resolved_profile(
+    mock_print, mock_set_current_session_state,
+    mock_collect_variables, mock_profile_manager, mock_session_state
+):
+    """Test that activate_profile skips the lookup when given a resolved profile."""
+    profile = {"profile_name": "test_profile"}
+    
+    result = activate_profile("test_profile", mock_session_state, resolved_profile=profile)
+    
+    assert result is True
+    mock_profile_manager.get_profile.assert_not_called()
+    assert mock_session_state.active_profile is profile
+
 @patch("aris.profile_handler.profile_manager")
 @patch("aris.profile_handler.print_formatted_text")
 def test_activate_profile_not_found(mock_print, mock_profile_manager, mock_session_state):
@@ -41,7 +41,7 @@ class TestProgressTrackingIntegration:
     @pytest.mark.asyncio
     async def test_non_interactive_mode_creates_progress_tracker(self):
         """Test that non-interactive mode creates and uses a progress tracker."""
-        with patch('aris.session_state.get_current_session_state') as mock_get_session, \
+        with patch('aris.cli.get_current_session_state') as mock_get_session, \
              patch('aris.cli.execute_single_turn', new_callable=AsyncMock) as mock_execute, \
              patch('aris.cli.workspace_manager'), \
              patch('sys.exit'), \
@@ -65,7 +65,7 @@ class TestProgressTrackingIntegration:
     @pytest.mark.asyncio
     async def test_non_interactive_verbose_mode_disables_progress(self):
         """Test that verbose mode disables progress tracking display."""
-        with patch('aris.session_state.get_current_session_state') as mock_get_session, \
+        with patch('aris.cli.get_current_session_state') as mock_get_session, \
              patch('aris.cli.execute_single_turn', new_callable=AsyncMock) as mock_execute, \
              patch('aris.cli.workspace_manager'), \
              patch('sys.exit'), \
@@ -91,7 +91,7 @@ class TestResponseFormattingIntegration:
     @pytest.mark.asyncio
     async def test_end_to_end_response_formatting(self):
         """Test complete end-to-end response formatting in non-interactive mode."""
-        with patch('aris.session_state.get_current_session_state') as mock_get_session, \
+        with patch('aris.cli.get_current_session_state') as mock_get_session, \
              patch('aris.cli.execute_single_turn', new_callable=AsyncMock) as mock_execute, \
              patch('aris.cli.workspace_manager'), \
              patch('sys.exit'), \
@@ -255,7 +255,7 @@ class TestErrorHandlingWithProgressAndFormatting:
     @pytest.mark.asyncio
     async def test_error_during_execution_stops_progress(self):
         """Test that errors properly stop progress tracking."""
-        with patch('aris.session_state.get_current_session_state') as mock_get_session, \
+        with patch('aris.cli.get_current_session_state') as mock_get_session, \
              patch('aris.cli.execute_single_turn', new_callable=AsyncMock) as mock_execute, \
              patch('aris.cli.workspace_manager'), \
              patch('sys.exit'), \
@@ -207,6 +207,24 @@ class TestProgressTrackerWithInsights:
             
             assert summary is None
     
+    def test_has_metrics_without_insights(self):
+        """Test has_metrics when insights are disabled."""
+        tracker = ProgressTracker(interactive=False, show_progress=False, enable_insights=False)
+        
+        assert tracker.has_metrics() is False
+    
+    def test_has_metrics_tracks_recorded_activity(self):
+        """Test has_metrics only reports True once activity has been recorded."""
+        tracker = ProgressTracker(interactive=False, show_progress=False, enable_insights=True)
+        assert tracker.has_metrics() is False
+        
+        tracker.insights_collector.metrics.current_cost_usd = 0.12
+        assert tracker.has_metrics() is True
+        
+        tracker.insights_collector.metrics.current_cost_usd = 0.0
+        tracker.insights_collector.metrics.workspace_files_created.append("new.txt")
+        assert tracker.has_metrics() is True
+    
     def test_workspace_changes_processing(self, mock_insights_collector):
         """Test workspace changes processing during chunk analysis."""
         with patch('aris.progress_tracker.SessionInsightsCollector', return_value=mock_insights_collector):
@@ -98,6 +98,18 @@ Third line"""
         
         assert result == "🤖 aris: Test message"
     
+    def test_session_state_without_active_profile(self):
+        """Test handling a session state object that lacks active_profile."""
+        result = format_non_interactive_response("Test message", object())
+        
+        assert result == "🤖 aris: Test message"
+    
+    def test_tracker_without_insights_support(self):
+        """Test that a tracker lacking the insights API adds no footer."""
+        result = format_non_interactive_response("Test message", None, object())
+        
+        assert result == "🤖 aris: Test message"
+    
     def test_profile_without_name(self):
         """Test handling profile without profile_name."""
         session_state = MagicMock()
@@ -98,6 +98,26 @@ class TestWorkspaceManager:
         assert os.getcwd() == self.original_cwd
         assert self.workspace_manager.current_workspace is None
     
+    def test_restore_original_directory_skips_chdir_when_not_switched(self):
+        """Test that restoring without a workspace switch issues no chdir."""
+        self.workspace_manager.original_cwd = self.original_cwd
+        
+        with patch('os.chdir') as mock_chdir:
+            self.workspace_manager.restore_original_directory()
+        
+        mock_chdir.assert_not_called()
+    
+    def test_restore_original_directory_only_once(self):
+        """Test that a second restore after a workspace switch is a no-op."""
+        self.workspace_manager.setup_workspace(self.test_dir)
+        self.workspace_manager.restore_original_directory()
+        
+        with patch('os.chdir') as mock_chdir:
+            self.workspace_manager.restore_original_directory()
+        
+        mock_chdir.assert_not_called()
+        assert os.getcwd() == self.original_cwd
+    
     def test_restore_original_directory_no_original(self):
         """Test restoring when no original directory is set."""
         # Should not raise an error